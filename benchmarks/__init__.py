@@ -0,0 +1,11 @@
+# benchmarks/__init__.py
+"""
+Benchmark suite for the Productivity Dashboard.
+
+Run everything with `python -m benchmarks --output results.json`, then
+compare two runs with `python -m benchmarks compare old.json new.json`.
+Nothing here touches the network or your real ~/.productivity_dashboard.
+
+bench_database.py and bench_startup.py are standalone scripts for the
+connection and CLI startup comparisons.
+"""
@@ -0,0 +1,95 @@
+# benchmarks/__main__.py
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+from benchmarks.common import isolate_home
+
+SCENARIOS = ["tasks", "render", "fetch", "focus", "daemon", "terminal", "startup", "memory"]
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(args):
+    # Must happen before any dashboard module reads Path.home()
+    isolate_home()
+
+    import importlib
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": {},
+    }
+
+    for name in args.scenario or SCENARIOS:
+        module = importlib.import_module(f"benchmarks.{name}")
+        kwargs = {"sizes": args.sizes} if name == "tasks" and args.sizes else {}
+        print(f"running {name}...", file=sys.stderr)
+        start = time.perf_counter()
+        report["results"][name] = module.run(**kwargs)
+        print(f"  done in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+def flatten(results, prefix=""):
+    for key, value in results.items():
+        if isinstance(value, dict) and "median_ms" in value:
+            yield f"{prefix}{key}", value["median_ms"]
+        elif isinstance(value, dict):
+            yield from flatten(value, f"{prefix}{key}.")
+
+def compare(args):
+    with open(args.old) as f:
+        old = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+
+    old_medians = dict(flatten(old["results"]))
+    print(f"{'benchmark':<50}{old['meta']['commit'] or 'old':>12}{new['meta']['commit'] or 'new':>12}{'change':>10}")
+    for name, median in flatten(new["results"]):
+        if name not in old_medians:
+            continue
+        before = old_medians[name]
+        change = (median - before) / before * 100 if before else 0.0
+        marker = "  <-- slower" if change > args.threshold else ""
+        print(f"{name:<50}{before:>10.2f}ms{median:>10.2f}ms{change:>+9.1f}%{marker}")
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Productivity Dashboard benchmarks")
+    subparsers = parser.add_subparsers(dest="command")
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two result files by median time")
+    compare_parser.add_argument("old")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=10.0, help="Flag slowdowns above this percent")
+
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS, help="Run only this scenario (repeatable)")
+    parser.add_argument("--sizes", type=int, nargs="+", help="Task counts for the tasks scenario")
+    parser.add_argument("--output", "-o", help="Write JSON results here instead of stdout")
+
+    args = parser.parse_args()
+    if args.command == "compare":
+        compare(args)
+    else:
+        run(args)
+
+if __name__ == "__main__":
+    main()
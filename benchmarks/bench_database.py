@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# bench_database.py
+"""
+Per-operation latency of TaskManager: a connection per call (the old
+behaviour) against the persistent WAL connection.
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "productivity_dashboard"))
+
+from database import TaskManager
+
+class ConnectPerCallTaskManager:
+    """The pre-pooling TaskManager: open, run one statement, commit, close."""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+
+    def _run(self, sql, params=()):
+        conn = sqlite3.connect(self.db_path)
+        rows = conn.execute(sql, params).fetchall()
+        conn.commit()
+        conn.close()
+        return rows
+
+    def add_task(self, description, priority="Medium"):
+        self._run("INSERT INTO tasks (description, priority) VALUES (?, ?)", (description, priority))
+
+    def get_tasks(self):
+        return self._run("SELECT * FROM tasks ORDER BY priority DESC, created_at DESC")
+
+    def complete_task(self, task_id):
+        self._run(
+            "UPDATE tasks SET completed = TRUE, completed_at = CURRENT_TIMESTAMP WHERE id = ?",
+            (task_id,)
+        )
+
+    def delete_task(self, task_id):
+        self._run("DELETE FROM tasks WHERE id = ?", (task_id,))
+
+def time_ops(manager, n):
+    results = {}
+
+    start = time.perf_counter()
+    for i in range(n):
+        manager.add_task(f"Task {i}", "High")
+    results["add_task"] = (time.perf_counter() - start) / n
+
+    start = time.perf_counter()
+    for i in range(n):
+        manager.complete_task(i + 1)
+    results["complete_task"] = (time.perf_counter() - start) / n
+
+    start = time.perf_counter()
+    for _ in range(50):
+        manager.get_tasks()
+    results["get_tasks"] = (time.perf_counter() - start) / 50
+
+    start = time.perf_counter()
+    for i in range(n):
+        manager.delete_task(i + 1)
+    results["delete_task"] = (time.perf_counter() - start) / n
+
+    return results
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    with tempfile.TemporaryDirectory() as tmp:
+        before_path = os.path.join(tmp, "before.db")
+        conn = sqlite3.connect(before_path)
+        conn.execute(
+            "CREATE TABLE tasks (id INTEGER PRIMARY KEY AUTOINCREMENT, description TEXT NOT NULL, "
+            "priority TEXT DEFAULT 'Medium', completed BOOLEAN DEFAULT FALSE, "
+            "created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, completed_at TIMESTAMP)"
+        )
+        conn.close()
+        before = time_ops(ConnectPerCallTaskManager(before_path), n)
+
+        manager = TaskManager(os.path.join(tmp, "after.db"))
+        after = time_ops(manager, n)
+        manager.close()
+
+    print(f"{'operation':<15}{'before (us)':>14}{'after (us)':>14}{'speedup':>10}")
+    for op in before:
+        print(f"{op:<15}{before[op] * 1e6:>14.1f}{after[op] * 1e6:>14.1f}{before[op] / after[op]:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
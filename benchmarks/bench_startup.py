@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# bench_startup.py
+"""
+Startup cost of the headless CLI, measured with python -X importtime.
+
+Usage: python benchmarks/bench_startup.py [budget_ms] [-- subcommand args...]
+Exits non-zero when the median wall time goes over budget (default 100 ms).
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+CLI = os.path.join(os.path.dirname(__file__), "..", "productivity_dashboard", "cli.py")
+
+def parse_importtime(stderr):
+    # Lines look like: "import time:  self [us] | cumulative | imported package"
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        imports.append((int(cumulative_us), int(self_us), name.rstrip()))
+    return imports
+
+def run_once(args, env, importtime=False, script=CLI):
+    cmd = [sys.executable] + (["-X", "importtime"] if importtime else []) + [script] + args
+    start = time.perf_counter()
+    result = subprocess.run(cmd, env=env, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise SystemExit(f"{' '.join(args)} failed:\n{result.stderr}")
+    return elapsed, result.stderr
+
+def main():
+    argv = sys.argv[1:]
+    command = ["tasks", "list"]
+    if "--" in argv:
+        command = argv[argv.index("--") + 1:]
+        argv = argv[:argv.index("--")]
+    budget_ms = float(argv[0]) if argv else 100.0
+
+    with tempfile.TemporaryDirectory() as home:
+        env = dict(os.environ, HOME=home)
+        run_once(["tasks", "add", "warm up the database"], env)
+
+        timings = [run_once(command, env)[0] * 1000 for _ in range(10)]
+        baseline = [run_once(["pass"], env, script="-c")[0] * 1000 for _ in range(10)]
+        _, stderr = run_once(command, env, importtime=True)
+
+    imports = parse_importtime(stderr)
+    # importtime indents nested imports; one leading space marks a top-level one
+    top_level = sorted((entry for entry in imports if not entry[2].startswith("  ")), reverse=True)
+
+    print(f"command: {' '.join(command)}")
+    print(f"wall time: median {statistics.median(timings):.1f} ms, min {min(timings):.1f} ms")
+    print(f"bare interpreter (python -c pass): median {statistics.median(baseline):.1f} ms")
+    print(f"imports: {len(imports)} modules, {sum(entry[1] for entry in imports) / 1000:.1f} ms")
+    print("slowest top-level imports:")
+    for cumulative_us, _, name in top_level[:10]:
+        print(f"  {cumulative_us / 1000:7.2f} ms  {name}")
+
+    for heavy in ("rich", "requests"):
+        if any(entry[2].strip() == heavy for entry in imports):
+            print(f"warning: {heavy} was imported")
+
+    if statistics.median(timings) > budget_ms:
+        print(f"FAIL: over the {budget_ms:.0f} ms budget")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# benchmarks/common.py
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+PACKAGE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "productivity_dashboard")
+if PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, PACKAGE_DIR)
+
+def isolate_home():
+    # Config, caches and tasks.db all live under HOME; never touch the real one
+    home = tempfile.mkdtemp(prefix="dashboard-bench-")
+    os.environ["HOME"] = home
+    return home
+
+class StaticConfig:
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, key, default=None):
+        value = self.values
+        for part in key.split("."):
+            if not isinstance(value, dict) or part not in value:
+                return default
+            value = value[part]
+        return value
+
+    def subscribe(self, callback):
+        # Never reloads, so there is nothing to notify
+        pass
+
+    def reload_if_changed(self, now=None):
+        return False
+
+def measure(func, repeat=20, warmup=1):
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    return {
+        "repeat": repeat,
+        "min_ms": samples[0],
+        "median_ms": statistics.median(samples),
+        "mean_ms": statistics.fmean(samples),
+        "p95_ms": samples[min(int(len(samples) * 0.95), len(samples) - 1)],
+        "max_ms": samples[-1],
+    }
+
+def sample_tasks(count, completed_ratio=0.7, seed=42):
+    rng = random.Random(seed)
+    words = ["write", "review", "report", "fix", "deploy", "email", "plan", "call", "update", "design"]
+    for i in range(count):
+        yield {
+            "description": f"{rng.choice(words)} {rng.choice(words)} #{i}",
+            "priority": rng.choice(["High", "Medium", "Low"]),
+            "completed": rng.random() < completed_ratio,
+        }
+
+def seed_task_manager(count, db_path):
+    from database import TaskManager
+
+    manager = TaskManager(db_path)
+    manager.import_tasks(sample_tasks(count))
+    return manager
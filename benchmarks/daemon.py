@@ -0,0 +1,81 @@
+# benchmarks/daemon.py
+import os
+import select
+import tempfile
+import threading
+import time
+
+from benchmarks.common import StaticConfig
+from benchmarks.stub_server import StubServer
+
+CLIENTS = [1, 50]
+REFRESHES = 5
+
+def make_config():
+    return StaticConfig({
+        "weather": {"api_key": "bench", "city": "London", "units": "metric", "min_interval": 0, "calls_per_hour": 10 ** 9},
+        "crypto": {"coins": ["bitcoin", "ethereum", "solana", "cardano"]},
+        # Every refresh goes upstream, so request counts reflect fetches, not cache hits
+        "cache": {"ttl": {"weather": 0, "crypto": 0}},
+    })
+
+def wait_for_crypto(clients, versions, timeout=5.0):
+    # Reads until every client has seen a crypto update newer than `versions`
+    waiting = {client for client in clients if client.version("crypto") <= versions[client]}
+    deadline = time.monotonic() + timeout
+    while waiting and time.monotonic() < deadline:
+        readable, _, _ = select.select(list(waiting), [], [], deadline - time.monotonic())
+        for client in readable:
+            client.read()
+            if client.version("crypto") > versions[client]:
+                waiting.discard(client)
+    return not waiting
+
+def run_clients(server, count):
+    from daemon import DaemonClient, FetchDaemon
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "daemon.sock")
+        # Refreshes are driven below, not by the daemon's timer
+        daemon = FetchDaemon(path=path, config=make_config(), refresh_interval=3600)
+        daemon.weather_api.base_url = f"{server.url}/data/2.5/weather"
+        daemon.crypto_api.base_url = f"{server.url}/api/v3"
+        daemon.start()
+        thread = threading.Thread(target=daemon.loop.run, daemon=True)
+        thread.start()
+
+        clients = [DaemonClient.connect(path) for _ in range(count)]
+        try:
+            if not wait_for_crypto(clients, {client: 0 for client in clients}):
+                raise RuntimeError(f"{count} clients: initial crypto update never arrived")
+
+            fanout = []
+            before = server.request_count
+            for refresh in range(REFRESHES):
+                versions = {client: client.version("crypto") for client in clients}
+                start = time.perf_counter()
+                daemon.fetcher.refresh()
+                if not wait_for_crypto(clients, versions):
+                    raise RuntimeError(f"{count} clients: refresh {refresh + 1} did not reach every client")
+                fanout.append((time.perf_counter() - start) * 1000)
+            requests = server.request_count - before
+        finally:
+            daemon.loop.stop()
+            daemon.loop.wakeup()
+            thread.join()
+            for client in clients:
+                client.shutdown()
+            daemon.close()
+
+    fanout.sort()
+    return {
+        "requests_per_refresh": requests / REFRESHES,
+        "refresh_to_all_clients": {"repeat": REFRESHES, "median_ms": fanout[len(fanout) // 2], "max_ms": fanout[-1]},
+    }
+
+def run():
+    results = {}
+    with StubServer() as server:
+        for count in CLIENTS:
+            results[f"clients_{count}"] = run_clients(server, count)
+    return results
@@ -0,0 +1,93 @@
+# benchmarks/fetch.py
+from benchmarks.common import StaticConfig, measure
+from benchmarks.stub_server import StubServer
+
+# (name, latency in seconds, failure rate)
+PROFILES = [
+    ("fast", 0.0, 0.0),
+    ("slow_50ms", 0.05, 0.0),
+    ("slow_200ms", 0.2, 0.0),
+    ("flaky_50pct", 0.05, 0.5),
+    ("down", 0.05, 1.0),
+]
+
+def make_clients(base_url):
+    from weather import WeatherAPI
+    from crypto import CryptoAPI
+
+    config = StaticConfig({
+        # No scheduling delay, so every call really goes to the stub
+        "weather": {"api_key": "bench", "city": "London", "units": "metric", "min_interval": 0, "calls_per_hour": 10 ** 9},
+        "crypto": {"coins": ["bitcoin", "ethereum", "solana", "cardano"]},
+    })
+    weather_api = WeatherAPI(config)
+    weather_api.base_url = f"{base_url}/data/2.5/weather"
+    crypto_api = CryptoAPI(config)
+    crypto_api.base_url = f"{base_url}/api/v3"
+    return weather_api, crypto_api
+
+def run(repeat=10):
+    import threading
+    from fetcher import BackgroundFetcher
+
+    results = {}
+    with StubServer() as server:
+        weather_api, crypto_api = make_clients(server.url)
+        # Errors are expected under the flaky profile; keep the report readable
+        weather_api.console.quiet = True
+        crypto_api.console.quiet = True
+
+        for name, latency, failure_rate in PROFILES:
+            server.configure(latency=latency, failure_rate=failure_rate)
+            fetcher = BackgroundFetcher({
+                "weather": weather_api.get_weather,
+                "crypto": crypto_api.get_crypto_prices,
+            })
+
+            completed = threading.Event()
+            fetcher.on_update = completed.set
+
+            def concurrent_refresh():
+                fetcher.refresh()
+                while fetcher.is_pending("weather") or fetcher.is_pending("crypto"):
+                    completed.wait()
+                    completed.clear()
+
+            before = server.request_count
+            results[name] = {
+                "weather": measure(weather_api.get_weather, repeat=repeat),
+                "crypto": measure(crypto_api.get_crypto_prices, repeat=repeat),
+                "concurrent_refresh": measure(concurrent_refresh, repeat=repeat),
+            }
+            results[name]["requests"] = server.request_count - before
+            fetcher.shutdown()
+
+        results["crypto_500_coins"] = run_large_watchlist(server)
+
+    return results
+
+def run_large_watchlist(server, coins=500, repeat=10):
+    from crypto import CryptoAPI, PriceTable
+
+    server.configure(latency=0.05, failure_rate=0.0)
+    config = StaticConfig({
+        "crypto": {
+            "coins": [f"coin-{i}" for i in range(coins)],
+            "vs_currencies": ["usd", "eur", "btc"],
+        },
+    })
+    results = {}
+
+    for batch_size in (coins, 100):
+        config.values["crypto"]["batch_size"] = batch_size
+        crypto_api = CryptoAPI(config)
+        crypto_api.base_url = f"{server.url}/api/v3"
+
+        before = server.request_count
+        results[f"batch_{batch_size}"] = measure(crypto_api.get_crypto_prices, repeat=repeat)
+        results[f"batch_{batch_size}"]["requests_per_refresh"] = (server.request_count - before) / (repeat + 1)
+
+    snapshot = crypto_api.get_crypto_prices()
+    results["rows_fetched"] = sum(1 for _ in PriceTable.from_dict(snapshot).rows())
+    results["top_movers_10"] = measure(lambda: PriceTable.from_dict(snapshot).top_movers(10), repeat=repeat)
+    return results
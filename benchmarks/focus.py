@@ -0,0 +1,83 @@
+# benchmarks/focus.py
+import os
+import tempfile
+
+from benchmarks.common import measure
+
+SIZES = [1000, 100000]
+INDEX_RULES = 1000000
+
+HOSTS = """127.0.0.1\tlocalhost
+::1\tlocalhost ip6-localhost ip6-loopback
+192.168.1.10\tnas.local
+"""
+
+def write_blocklist(path, count):
+    with open(path, "w") as f:
+        for i in range(count):
+            f.write(f"0.0.0.0 tracker{i}.example.com\n")
+
+def write_rules(path, count):
+    # Half exact names, half wildcard suffixes, plus a few allow-list exceptions
+    with open(path, "w") as f:
+        for i in range(count):
+            f.write(f"*.site{i}.example.net\n" if i % 2 else f"site{i}.example.org\n")
+        for i in range(1, count, 1000):
+            f.write(f"!allowed.site{i}.example.net\n")
+
+def hosts_to_check(count):
+    for i in range(count):
+        yield f"cdn.assets.site{i * 7919 % INDEX_RULES}.example.net"
+        yield f"site{i * 104729 % INDEX_RULES}.example.org"
+        yield f"unrelated{i}.example.com"
+
+def run_index(repeat=3):
+    from blocklist import load_index
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rules_path = os.path.join(tmp, "rules.txt")
+        cache_path = os.path.join(tmp, "blocklist.cache")
+        write_rules(rules_path, INDEX_RULES)
+
+        def compile_rules():
+            if os.path.exists(cache_path):
+                os.unlink(cache_path)
+            return load_index([], [rules_path], cache_path)
+
+        results = {"compile": measure(compile_rules, repeat=repeat, warmup=0)}
+        results["load_cached"] = measure(lambda: load_index([], [rules_path], cache_path), repeat=repeat)
+
+        index = load_index([], [rules_path], cache_path)
+        hosts = list(hosts_to_check(10000))
+        results["is_blocked_30k"] = measure(lambda: [index.is_blocked(host) for host in hosts], repeat=repeat)
+        results["cache_bytes"] = os.path.getsize(cache_path)
+
+    return results
+
+def run(sizes=SIZES, repeat=10):
+    from focus_mode import FocusMode
+
+    results = {}
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            hosts_path = os.path.join(tmp, "hosts")
+            blocklist_path = os.path.join(tmp, "blocklist.txt")
+            with open(hosts_path, "w") as f:
+                f.write(HOSTS)
+            write_blocklist(blocklist_path, size)
+
+            focus_mode = FocusMode(
+                sites=["reddit.com"], blocklist_path=blocklist_path, hosts_path=hosts_path,
+                cache_path=os.path.join(tmp, "blocklist.cache")
+            )
+            results[str(size)] = {
+                "enable": measure(focus_mode.enable, repeat=repeat),
+                "toggle": measure(lambda: (focus_mode.enable(), focus_mode.disable()), repeat=repeat),
+            }
+
+            # Toggling must leave the hosts file exactly as it was
+            with open(hosts_path) as f:
+                assert f.read() == HOSTS
+
+    results[f"index_{INDEX_RULES}"] = run_index()
+    return results
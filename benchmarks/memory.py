@@ -0,0 +1,57 @@
+# benchmarks/memory.py
+import gc
+import os
+import tracemalloc
+
+from benchmarks.common import seed_task_manager
+
+def dict_row(row):
+    # How tasks were represented before Task: one dict per row
+    return {
+        "id": row[0],
+        "description": row[1],
+        "priority": row[2],
+        "completed": bool(row[3]),
+        "created_at": row[4],
+        "completed_at": row[5],
+        "priority_rank": row[6]
+    }
+
+def trace(func):
+    # Peak and still-held memory while func() runs, in KB
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {"retained_kb": round(current / 1024), "peak_kb": round(peak / 1024)}
+
+def run(count=100_000):
+    from database import TASK_COLUMNS
+
+    db_path = os.path.join(os.environ["HOME"], "memory.db")
+    manager = seed_task_manager(count, db_path)
+    sql = f"SELECT {TASK_COLUMNS} FROM tasks ORDER BY completed, priority_rank DESC, created_at DESC, id DESC"
+
+    def dict_list():
+        with manager.lock:
+            rows = manager.conn.execute(sql).fetchall()
+        return [dict_row(row) for row in rows]
+
+    def drain():
+        for task in manager.iter_tasks():
+            pass
+
+    results = {
+        "tasks": count,
+        "dict_list": trace(dict_list),
+        "task_list": trace(manager.get_tasks),
+        "iter_tasks": trace(drain),
+    }
+    for name in ("task_list", "iter_tasks"):
+        results[name]["peak_vs_dict"] = round(results[name]["peak_kb"] / results["dict_list"]["peak_kb"], 3)
+    manager.close()
+    return results
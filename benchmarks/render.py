@@ -0,0 +1,72 @@
+# benchmarks/render.py
+import io
+import os
+import tempfile
+
+from benchmarks.common import measure, seed_task_manager
+
+WEATHER = [{"city": "London", "temperature": 12.5, "description": "Light Rain", "humidity": 81, "wind_speed": 14.4}]
+CRYPTO = {
+    "ids": ["bitcoin", "ethereum"],
+    "currencies": ["usd"],
+    "prices": {"usd": [64123.5, 3120.75]},
+    "changes": {"usd": [1.25, -0.8]},
+}
+
+def run(repeat=20, tasks=1000, width=120, height=40):
+    from rich.console import Console
+    from dashboard import ProductivityDashboard
+    from diff_live import DiffLive
+    from task_view import TaskView
+
+    dashboard = ProductivityDashboard()
+    dashboard.setup_layout()
+    dashboard.fetcher.seed("weather", WEATHER)
+    dashboard.fetcher.seed("crypto", CRYPTO)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        dashboard.task_manager = seed_task_manager(tasks, os.path.join(tmp, "tasks.db"))
+        dashboard.panels["tasks"].view = TaskView(dashboard.task_manager)
+
+        def render():
+            console = Console(file=io.StringIO(), width=width, height=height, force_terminal=True)
+            console.print(dashboard.layout)
+
+        def full_refresh():
+            # Forget every panel token so each region is rebuilt, then draw
+            dashboard.panel_tokens.clear()
+            dashboard.refresh_panels()
+            render()
+
+        def idle_refresh():
+            dashboard.refresh_panels()
+
+        results["full_refresh_render"] = measure(full_refresh, repeat=repeat)
+        results["panels_only_rebuild"] = measure(
+            lambda: (dashboard.panel_tokens.clear(), dashboard.refresh_panels()), repeat=repeat
+        )
+        results["idle_refresh"] = measure(idle_refresh, repeat=repeat)
+        results["render_only"] = measure(render, repeat=repeat)
+
+        # A clock tick in low-bandwidth mode: the whole layout is rendered,
+        # then only the changed cells are written
+        console = Console(file=io.StringIO(), width=width, height=height, force_terminal=True, force_interactive=True)
+        live = DiffLive(
+            dashboard.layout, console=console, auto_refresh=False, screen=True,
+            redirect_stdout=False, redirect_stderr=False
+        )
+        live.start(refresh=True)
+
+        def diff_frame():
+            dashboard.panel_tokens.pop("header", None)
+            dashboard.refresh_panels()
+            live.refresh()
+
+        results["diff_frame"] = measure(diff_frame, repeat=repeat)
+        live.stop()
+
+        dashboard.task_manager.close()
+
+    dashboard.fetcher.shutdown()
+    return results
@@ -0,0 +1,63 @@
+# benchmarks/startup.py
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from benchmarks.common import PACKAGE_DIR
+
+# (name, "panels" section of config.json)
+CONFIGS = [
+    ("all_panels", {}),
+    ("tasks_only", {name: {"enabled": False} for name in ("weather", "crypto", "timer")}),
+]
+
+# Fresh interpreter per sample, so imports are part of the cost
+CHILD = """
+import sys, time
+start = time.perf_counter()
+sys.path.insert(0, sys.argv[1])
+from dashboard import ProductivityDashboard
+dashboard = ProductivityDashboard()
+elapsed = time.perf_counter() - start
+dashboard.local_fetcher.shutdown()
+print(elapsed * 1000, "requests" in sys.modules)
+"""
+
+def write_config(home, panels):
+    config_dir = os.path.join(home, ".productivity_dashboard")
+    os.makedirs(config_dir, exist_ok=True)
+    with open(os.path.join(config_dir, "config.json"), "w") as f:
+        json.dump({
+            "weather": {"api_key": "bench", "city": "London", "units": "metric"},
+            "crypto": {"coins": ["bitcoin", "ethereum"], "vs_currencies": ["usd"]},
+            "panels": panels,
+        }, f)
+
+def run(repeat=5):
+    results = {}
+    for name, panels in CONFIGS:
+        home = os.path.join(os.environ["HOME"], f"startup-{name}")
+        write_config(home, panels)
+        env = dict(os.environ, HOME=home)
+
+        samples = []
+        for _ in range(repeat + 1):
+            output = subprocess.run(
+                [sys.executable, "-c", CHILD, PACKAGE_DIR], env=env, capture_output=True, text=True, check=True
+            ).stdout.split()
+            samples.append(float(output[0]))
+        # The first run also creates tasks.db
+        samples = sorted(samples[1:])
+
+        results[name] = {
+            "construct": {
+                "repeat": repeat,
+                "min_ms": samples[0],
+                "median_ms": statistics.median(samples),
+                "max_ms": samples[-1],
+            },
+            "imports_requests": output[1] == "True",
+        }
+    return results
@@ -0,0 +1,98 @@
+# benchmarks/stub_server.py
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+class StubHandler(BaseHTTPRequestHandler):
+    # Keep-alive, like the real APIs
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; avoid Nagle/delayed-ACK stalls
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        server.request_count += 1
+        time.sleep(server.latency)
+
+        if server.rng.random() < server.failure_rate:
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+
+        if url.path.endswith("/weather"):
+            body = {
+                "main": {"temp": 12.5, "humidity": 81},
+                "weather": [{"description": "light rain"}],
+                "wind": {"speed": 4.0},
+            }
+        elif url.path.endswith("/simple/price"):
+            currencies = query.get("vs_currencies", ["usd"])[0].split(",")
+            body = {}
+            for coin in query.get("ids", [""])[0].split(","):
+                prices = {}
+                for currency in currencies:
+                    prices[currency] = server.rng.uniform(0.01, 70000)
+                    prices[f"{currency}_24h_change"] = server.rng.uniform(-10, 10)
+                body[coin] = prices
+        else:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for header, value in server.extra_headers.items():
+            self.send_header(header, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+class StubServer:
+    """A local stand-in for OpenWeatherMap and CoinGecko with injectable latency and failures."""
+
+    def __init__(self, latency=0.0, failure_rate=0.0, seed=42):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.latency = latency
+        self.httpd.failure_rate = failure_rate
+        self.httpd.request_count = 0
+        self.httpd.extra_headers = {}
+        self.httpd.rng = random.Random(seed)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}"
+
+    def configure(self, latency=None, failure_rate=None, headers=None):
+        if latency is not None:
+            self.httpd.latency = latency
+        if failure_rate is not None:
+            self.httpd.failure_rate = failure_rate
+        if headers is not None:
+            self.httpd.extra_headers = headers
+
+    @property
+    def request_count(self):
+        return self.httpd.request_count
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
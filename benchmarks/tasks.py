@@ -0,0 +1,53 @@
+# benchmarks/tasks.py
+import os
+import tempfile
+
+from benchmarks.common import measure, seed_task_manager
+
+SIZES = [1000, 10000, 100000]
+
+def run(sizes=SIZES, repeat=10):
+    from dashboard import ProductivityDashboard
+    from task_view import TaskView
+
+    dashboard = ProductivityDashboard()
+    results = {}
+
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = seed_task_manager(size, os.path.join(tmp, "tasks.db"))
+            dashboard.task_manager = manager
+            panel = dashboard.panels["tasks"]
+            panel.view = TaskView(manager)
+            view = panel.view
+
+            def page_down():
+                # Wraps back to the top at the end so every repeat really scrolls
+                if view.position + view.rows >= view.total:
+                    view.position = 0
+                view.page(1)
+                panel.render()
+
+            def jump():
+                # Far from the loaded rows: the window has to be refetched
+                view.position = 0 if view.position else view.total
+                panel.render()
+
+            def filter_pending_high():
+                view.hide_completed, view.priority = True, "High"
+                view.reset()
+                panel.render()
+
+            results[str(size)] = {
+                "get_tasks_all": measure(manager.get_tasks, repeat=repeat),
+                "get_tasks_page": measure(lambda: manager.get_tasks(limit=50), repeat=repeat),
+                "get_tasks_pending": measure(lambda: manager.get_tasks(include_completed=False), repeat=repeat),
+                "update_tasks": measure(panel.render, repeat=repeat),
+                "scroll_page": measure(page_down, repeat=repeat),
+                "scroll_jump": measure(jump, repeat=repeat),
+                "filter_pending_high": measure(filter_pending_high, repeat=repeat),
+            }
+            manager.close()
+
+    dashboard.fetcher.shutdown()
+    return results
@@ -0,0 +1,100 @@
+# benchmarks/terminal.py
+import fcntl
+import json
+import os
+import pty
+import select
+import struct
+import subprocess
+import sys
+import termios
+import time
+
+from benchmarks.common import PACKAGE_DIR
+from benchmarks.stub_server import StubServer
+
+# (name, display settings written to config.json)
+MODES = [
+    ("full", {}),
+    ("diff", {"low_bandwidth": True, "clock": "seconds", "min_redraw_interval": 0}),
+    ("low_bandwidth", {"low_bandwidth": True}),
+]
+
+# Runs the real dashboard against the stub server, so the only output is
+# what the dashboard itself draws
+CHILD = """
+import sys
+sys.path.insert(0, sys.argv[1])
+from dashboard import ProductivityDashboard
+dashboard = ProductivityDashboard()
+dashboard.panels["weather"].api.base_url = sys.argv[2] + "/data/2.5/weather"
+dashboard.panels["crypto"].api.base_url = sys.argv[2] + "/api/v3"
+dashboard.run()
+"""
+
+def write_config(home, display):
+    config_dir = os.path.join(home, ".productivity_dashboard")
+    os.makedirs(config_dir, exist_ok=True)
+    with open(os.path.join(config_dir, "config.json"), "w") as f:
+        json.dump({
+            "weather": {"api_key": "bench", "city": "London", "units": "metric"},
+            "crypto": {"coins": ["bitcoin", "ethereum"], "vs_currencies": ["usd"]},
+            "display": display,
+        }, f)
+
+def read_for(fd, seconds):
+    # Bytes the dashboard wrote to the terminal in the next `seconds`
+    total = 0
+    deadline = time.monotonic() + seconds
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return total
+        readable, _, _ = select.select([fd], [], [], remaining)
+        if readable:
+            try:
+                total += len(os.read(fd, 65536))
+            except OSError:
+                return total
+
+def measure_idle(server, name, display, duration, settle, width, height):
+    home = os.path.join(os.environ["HOME"], f"terminal-{name}")
+    write_config(home, display)
+
+    master, slave = pty.openpty()
+    fcntl.ioctl(slave, termios.TIOCSWINSZ, struct.pack("HHHH", height, width, 0, 0))
+    env = dict(os.environ, HOME=home, TERM="xterm-256color")
+    env.pop("COLUMNS", None)
+    env.pop("LINES", None)
+    process = subprocess.Popen(
+        [sys.executable, "-c", CHILD, PACKAGE_DIR, server.url],
+        stdin=slave, stdout=slave, stderr=slave, env=env, start_new_session=True
+    )
+    os.close(slave)
+
+    try:
+        # First paint and the initial fetches, then nothing but the clock,
+        # the periodic refresh and the tick loop
+        startup = read_for(master, settle)
+        idle = read_for(master, duration)
+    finally:
+        os.write(master, b"q")
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        os.close(master)
+
+    return {
+        "startup_bytes": startup,
+        "idle_seconds": duration,
+        "bytes_per_minute": round(idle * 60 / duration),
+    }
+
+def run(duration=60, settle=3, width=120, height=40):
+    results = {}
+    with StubServer() as server:
+        for name, display in MODES:
+            results[name] = measure_idle(server, name, display, duration, settle, width, height)
+    return results
@@ -0,0 +1,161 @@
+# blocklist.py
+import marshal
+import os
+import tempfile
+from pathlib import Path
+
+# Bump when the on-disk layout of the compiled index changes
+CACHE_VERSION = 1
+
+# Rule syntax, one per line or config entry:
+#   reddit.com       reddit.com and www.reddit.com
+#   *.reddit.com     reddit.com and every subdomain (".reddit.com" also works)
+#   !old.reddit.com  allow-list exception; "@@" works as a prefix too
+# Exact rules beat wildcard rules, and the longest matching wildcard wins.
+
+def iter_rules(path):
+    # Streams rules from a plain list or a hosts-format file ("0.0.0.0 example.com")
+    with open(path, 'r', encoding="utf-8", errors="ignore") as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            parts = line.split()
+            for rule in parts[1:] if len(parts) > 1 else parts:
+                if rule not in ("localhost", "0.0.0.0", "127.0.0.1"):
+                    yield rule.lower()
+
+class BlocklistIndex:
+    # Two hashed sets keyed by domain: exact names and wildcard suffixes, each
+    # mapping to True (block) or False (allow). A lookup probes the host once
+    # per label, so it stays O(label count) however many rules are loaded.
+    def __init__(self):
+        self.exact = {}
+        self.wildcard = {}
+        self.has_exceptions = False
+        self.entries = None
+
+    def __len__(self):
+        return len(self.exact) + len(self.wildcard)
+
+    def add(self, rule):
+        rule = rule.strip().lower().rstrip(".")
+        block = True
+        if rule.startswith("!"):
+            rule, block = rule[1:], False
+        elif rule.startswith("@@"):
+            rule, block = rule[2:], False
+
+        self.has_exceptions = self.has_exceptions or not block
+        self.entries = None
+        if rule.startswith("*."):
+            self.wildcard[rule[2:]] = block
+        elif rule.startswith("."):
+            self.wildcard[rule[1:]] = block
+        elif rule:
+            self.exact[rule] = block
+
+    def update(self, rules):
+        for rule in rules:
+            self.add(rule)
+
+    def is_blocked(self, host):
+        host = host.strip().lower().rstrip(".")
+        verdict = self.exact.get(host)
+        if verdict is None and host.startswith("www."):
+            verdict = self.exact.get(host[4:])
+        if verdict is not None:
+            return verdict
+
+        # host, then each parent domain, longest first
+        start = 0
+        wildcard = self.wildcard
+        while True:
+            verdict = wildcard.get(host[start:])
+            if verdict is not None:
+                return verdict
+            start = host.find(".", start) + 1
+            if not start:
+                return False
+
+    def host_entries(self):
+        # The hosts file has no wildcards, so a wildcard rule contributes
+        # only its apex and www. name; allow-list exceptions are removed
+        if self.entries is not None:
+            return self.entries
+
+        candidates = set()
+        for domain, block in self.exact.items():
+            if block:
+                candidates.add(domain)
+                if not domain.startswith("www."):
+                    candidates.add(f"www.{domain}")
+        for domain, block in self.wildcard.items():
+            if block:
+                candidates.add(domain)
+                candidates.add(f"www.{domain}")
+        if self.has_exceptions:
+            candidates = {domain for domain in candidates if self.is_blocked(domain)}
+        self.entries = candidates
+        return candidates
+
+    def save(self, path, signature):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(marshal.dumps((CACHE_VERSION, signature, self.exact, self.wildcard)))
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    @classmethod
+    def load(cls, path, signature):
+        # Returns None when the cache is missing, corrupt or built from other sources
+        try:
+            # One bulk read: marshal.load() on a file object reads in small chunks
+            with open(path, 'rb') as f:
+                version, cached_signature, exact, wildcard = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if version != CACHE_VERSION or cached_signature != signature:
+            return None
+
+        index = cls()
+        index.exact = exact
+        index.wildcard = wildcard
+        index.has_exceptions = not all(exact.values()) or not all(wildcard.values())
+        return index
+
+def source_signature(sites, paths):
+    # Inline rules plus (path, mtime, size) per file: any edit forces a recompile
+    files = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            files.append((str(path), stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            files.append((str(path), None, None))
+    return (tuple(sites), tuple(files))
+
+def load_index(sites, paths=(), cache_path=None):
+    cache_path = Path(cache_path) if cache_path else Path.home() / ".productivity_dashboard" / "blocklist.cache"
+    signature = source_signature(sites, paths)
+
+    index = BlocklistIndex.load(cache_path, signature)
+    if index is not None:
+        return index
+
+    index = BlocklistIndex()
+    index.update(sites)
+    for path in paths:
+        try:
+            index.update(iter_rules(path))
+        except OSError:
+            continue
+    index.save(cache_path, signature)
+    return index
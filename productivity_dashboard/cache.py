@@ -0,0 +1,129 @@
+# cache.py
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+class ResponseCache:
+    def __init__(self, cache_dir=None, max_bytes=1024 * 1024, max_age=7 * 24 * 3600):
+        self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / ".productivity_dashboard" / "cache"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+    def _path(self, key, suffix=".json"):
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return self.cache_dir / f"{digest}{suffix}"
+
+    def load(self, key):
+        try:
+            with open(self._path(key), 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None, None
+
+        if entry.get("key") != key:
+            return None, None
+        return entry.get("value"), entry.get("stored_at")
+
+    def store(self, key, value):
+        self._write(self._path(key), {"key": key, "stored_at": time.time(), "value": value})
+
+    def _write(self, path, data):
+        # Write to a temp file and rename so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    @contextmanager
+    def _lock(self, key):
+        if fcntl is None:
+            yield
+            return
+
+        with open(self._path(key, ".lock"), 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    @contextmanager
+    def shared_state(self, key):
+        # A small JSON document that several processes read and update in
+        # turn, such as a request budget. The key's lock is held until the
+        # caller is done, and .state files are never evicted.
+        path = self._path(key, ".state")
+        with self._lock(key):
+            try:
+                with open(path, 'r') as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                state = {}
+            yield state
+            self._write(path, state)
+
+    def fetch(self, key, ttl, fetch_func):
+        value, stored_at = self.load(key)
+        if value is not None and time.time() - stored_at < ttl:
+            return value
+
+        # Only one process revalidates a key; the others wait and reuse its result
+        with self._lock(key):
+            value, stored_at = self.load(key)
+            if value is not None and time.time() - stored_at < ttl:
+                return value
+
+            result = fetch_func()
+            if result is None:
+                return value
+
+            self.store(key, result)
+
+        self.evict()
+        return result
+
+    def evict(self):
+        now = time.time()
+        entries = []
+
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+
+            if now - stat.st_mtime > self.max_age:
+                self._remove(path)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        # Drop the oldest entries until the cache fits in max_bytes
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def _remove(self, path):
+        # Lock files are left in place so a concurrent revalidation keeps its lock
+        try:
+            path.unlink()
+        except OSError:
+            pass
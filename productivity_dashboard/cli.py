@@ -0,0 +1,284 @@
+# cli.py
+# Keep module-level imports to the standard library's cheap modules: every
+# subcommand imports only what it needs, so `tasks list` starts in a few ms
+# and never loads rich, requests or the dashboard.
+import argparse
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+# Add the current directory to the path to ensure local imports work
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+@contextmanager
+def open_stream(path, mode):
+    if path == "-":
+        yield sys.stdin if "r" in mode else sys.stdout
+    else:
+        with open(path, mode, newline="", encoding="utf-8") as f:
+            yield f
+
+def report(action, count, elapsed):
+    rate = count / elapsed if elapsed > 0 else float("inf")
+    print(f"{action} {count} tasks in {elapsed:.2f}s ({rate:,.0f} rows/sec)", file=sys.stderr)
+
+def task_manager():
+    from database import TaskManager
+    return TaskManager()
+
+def print_tasks(tasks, as_json=False):
+    if as_json:
+        json.dump([task.to_dict() for task in tasks], sys.stdout)
+        print()
+        return
+
+    for task in tasks:
+        status = "x" if task.completed else " "
+        print(f"[{status}] {task.id:>6}  {task.priority:<6}  {task.description}")
+
+def tasks_add(args):
+    task_manager().add_task(args.description, args.priority)
+
+def tasks_list(args):
+    manager = task_manager()
+    if args.limit is None:
+        # Stream the whole list rather than loading it first
+        tasks = manager.iter_tasks(include_completed=args.all)
+    else:
+        tasks = manager.get_tasks(limit=args.limit, include_completed=args.all)
+    print_tasks(tasks, args.json)
+
+def tasks_done(args):
+    manager = task_manager()
+    for task_id in args.ids:
+        manager.complete_task(task_id)
+
+def tasks_rm(args):
+    manager = task_manager()
+    for task_id in args.ids:
+        manager.delete_task(task_id)
+
+def tasks_import(args):
+    from task_io import detect_format, read_tasks
+
+    manager = task_manager()
+    fmt = detect_format(args.file, args.format)
+
+    start = time.perf_counter()
+    with open_stream(args.file, "r") as f:
+        count = manager.import_tasks(read_tasks(f, fmt), chunk_size=args.chunk_size)
+    report("Imported", count, time.perf_counter() - start)
+
+def tasks_export(args):
+    from task_io import detect_format, write_tasks
+
+    manager = task_manager()
+    fmt = detect_format(args.file, args.format)
+
+    start = time.perf_counter()
+    with open_stream(args.file, "w") as f:
+        count = write_tasks(f, manager.iter_rows(), fmt)
+    report("Exported", count, time.perf_counter() - start)
+
+def tasks_search(args):
+    print_tasks(task_manager().search(args.query, limit=args.limit), args.json)
+
+def timer_status(args):
+    from focus_timer import FocusTimer
+
+    timer = FocusTimer()
+    # No dashboard may be running to move the timer on; work out the
+    # current phase from the saved end time
+    timer.catch_up()
+    status = timer.get_status()
+    if args.json:
+        print(json.dumps(status))
+    else:
+        print(f"{status['mode']}  {status['time_remaining']}  session {status['sessions_completed']}/4")
+
+def show_stats(args):
+    from database import format_duration
+
+    result = task_manager().get_stats(days=args.days)
+    if args.json:
+        print(json.dumps(result))
+        return
+
+    print(f"Since {result['since']} ({args.days} days)")
+    completed = result["completed"]
+    print(f"Completed: {result['completed_total']} "
+          f"(High {completed['High']}, Medium {completed['Medium']}, Low {completed['Low']})")
+    print(f"Average time to complete: {format_duration(result['avg_completion_seconds'])}")
+    print(f"Focus: {result['focus_minutes']} minutes in {result['focus_sessions']} sessions")
+    if args.days > 1:
+        print()
+        for day, counts in result["by_day"].items():
+            print(f"{day}  {counts['completed']:>4} done  {counts['focus_minutes']:>4} focus min")
+
+def cached_fetch(config, api, source, default_ttl, fetch):
+    from cache import ResponseCache
+
+    cache = ResponseCache()
+    return cache.fetch(api.cache_key, config.get(f"cache.ttl.{source}", default_ttl), fetch)
+
+def weather(args):
+    from config import Config
+    from weather import WeatherAPI
+
+    config = Config()
+    api = WeatherAPI(config)
+    data = cached_fetch(config, api, "weather", 600, api.get_weather)
+    if data is None:
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(data))
+    else:
+        for reading in data:
+            print(f"{reading['city']}: {reading['temperature']}°C, {reading['description']}, "
+                  f"humidity {reading['humidity']}%, wind {reading['wind_speed']:.1f} km/h")
+
+def crypto(args):
+    from config import Config
+    from crypto import CryptoAPI, PriceTable, display_name, format_price
+
+    config = Config()
+    api = CryptoAPI(config)
+    data = cached_fetch(config, api, "crypto", 60, api.get_crypto_prices)
+    if data is None:
+        sys.exit(1)
+
+    table = PriceTable.from_dict(data)
+    if args.json:
+        # Same shape as CoinGecko's /simple/price
+        result = {}
+        for currency in table.currencies:
+            for coin, price, change in table.rows(currency):
+                result.setdefault(coin, {})[currency] = price
+                result[coin][f"{currency}_24h_change"] = None if change != change else change
+        print(json.dumps(result))
+    else:
+        for coin, price, change in table.rows():
+            line = f"{display_name(coin)}: {format_price(price, table.currencies[0])}"
+            if change == change:  # NaN when CoinGecko has no 24h change
+                line += f" ({change:+.2f}%)"
+            print(line)
+
+def daemon(args):
+    from daemon import FetchDaemon
+
+    if not FetchDaemon(refresh_interval=args.interval).run():
+        sys.exit(1)
+
+def setup(args):
+    from config import Config
+    Config().setup()
+
+def dashboard(args):
+    from dashboard import ProductivityDashboard
+    ProductivityDashboard(low_bandwidth=args.low_bandwidth).run()
+
+def add_task_commands(subparsers):
+    tasks_parser = subparsers.add_parser("tasks", help="Manage tasks from the command line")
+    tasks_commands = tasks_parser.add_subparsers(dest="tasks_command", required=True)
+
+    add_parser = tasks_commands.add_parser("add", help="Add a task")
+    add_parser.add_argument("description")
+    add_parser.add_argument("-p", "--priority", default="Medium", help="High, Medium or Low")
+    add_parser.set_defaults(func=tasks_add)
+
+    list_parser = tasks_commands.add_parser("list", help="List pending tasks, highest priority first")
+    list_parser.add_argument("-a", "--all", action="store_true", help="Include completed tasks")
+    list_parser.add_argument("-n", "--limit", type=int, help="Show at most this many tasks")
+    list_parser.add_argument("--json", action="store_true")
+    list_parser.set_defaults(func=tasks_list)
+
+    done_parser = tasks_commands.add_parser("done", help="Mark tasks as completed")
+    done_parser.add_argument("ids", type=int, nargs="+")
+    done_parser.set_defaults(func=tasks_done)
+
+    rm_parser = tasks_commands.add_parser("rm", help="Delete tasks")
+    rm_parser.add_argument("ids", type=int, nargs="+")
+    rm_parser.set_defaults(func=tasks_rm)
+
+    import_parser = tasks_commands.add_parser("import", help="Import tasks from a CSV or JSONL file")
+    import_parser.add_argument("file", help="File to read, or - for stdin")
+    import_parser.add_argument("--format", choices=["csv", "jsonl"], help="Defaults to the file extension")
+    import_parser.add_argument("--chunk-size", type=int, default=5000, help="Rows per transaction")
+    import_parser.set_defaults(func=tasks_import)
+
+    export_parser = tasks_commands.add_parser("export", help="Export all tasks to a CSV or JSONL file")
+    export_parser.add_argument("file", help="File to write, or - for stdout")
+    export_parser.add_argument("--format", choices=["csv", "jsonl"], help="Defaults to the file extension")
+    export_parser.set_defaults(func=tasks_export)
+
+    search_parser = tasks_commands.add_parser("search", help="Full-text search over task descriptions")
+    search_parser.add_argument("query", help="Words to match; each is matched as a prefix")
+    search_parser.add_argument("--limit", type=int, default=20)
+    search_parser.add_argument("--json", action="store_true")
+    search_parser.set_defaults(func=tasks_search)
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Intelligent CLI Productivity Dashboard")
+    parser.add_argument("--setup", action="store_true", help="Run initial setup")
+    parser.add_argument(
+        "--profile", metavar="FILE",
+        help="Record cProfile data and latency histograms, written to FILE (and FILE.prof) on exit"
+    )
+    parser.add_argument(
+        "--low-bandwidth", action="store_true",
+        help="Redraw only changed cells, at most once a second, with a minute clock (for SSH/mosh)"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    add_task_commands(subparsers)
+
+    timer_parser = subparsers.add_parser("timer", help="Focus timer")
+    timer_commands = timer_parser.add_subparsers(dest="timer_command", required=True)
+    status_parser = timer_commands.add_parser("status", help="Show the focus timer state")
+    status_parser.add_argument("--json", action="store_true")
+    status_parser.set_defaults(func=timer_status)
+
+    stats_parser = subparsers.add_parser("stats", help="Tasks completed and focus time, per day")
+    stats_parser.add_argument("-d", "--days", type=int, default=7, help="Days to cover, ending today")
+    stats_parser.add_argument("--json", action="store_true")
+    stats_parser.set_defaults(func=show_stats)
+
+    weather_parser = subparsers.add_parser("weather", help="Print the current weather")
+    weather_parser.add_argument("--json", action="store_true")
+    weather_parser.set_defaults(func=weather)
+
+    crypto_parser = subparsers.add_parser("crypto", help="Print cryptocurrency prices")
+    crypto_parser.add_argument("--json", action="store_true")
+    crypto_parser.set_defaults(func=crypto)
+
+    daemon_parser = subparsers.add_parser(
+        "daemon", help="Fetch once for every dashboard on this machine (runs in the foreground)"
+    )
+    daemon_parser.add_argument("--interval", type=int, default=30, help="Seconds between refreshes")
+    daemon_parser.set_defaults(func=daemon)
+
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.profile:
+        from instrumentation import profile_to
+        with profile_to(args.profile):
+            run(args)
+    else:
+        run(args)
+
+def run(args):
+    if args.command:
+        args.func(args)
+    elif args.setup:
+        setup(args)
+    else:
+        dashboard(args)
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,63 @@
 # config.py
 import json
 import os
+import time
 from pathlib import Path
 
+# Distinguishes "not in the config" from a stored None, {} or []
+_MISSING = object()
+
 class Config:
-    def __init__(self):
+    def __init__(self, check_interval=2.0):
         self.config_path = Path.home() / ".productivity_dashboard" / "config.json"
         self.config_dir = self.config_path.parent
+        # At most one stat() of config.json per interval
+        self.check_interval = check_interval
+        self.last_check = time.monotonic()
+        self.subscribers = []
         self.config = self.load_config()
+        self.values = {}
+        self.signature = self.file_signature()
+    
+    def file_signature(self):
+        # mtime alone misses editors that replace the file within the same
+        # timestamp tick; inode and size catch those
+        try:
+            stat = os.stat(self.config_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_ino, stat.st_size
+    
+    def subscribe(self, callback):
+        # callback(config) runs after every reload that changed the file
+        self.subscribers.append(callback)
+    
+    def reload_if_changed(self, now=None):
+        now = time.monotonic() if now is None else now
+        if now - self.last_check < self.check_interval:
+            return False
+        self.last_check = now
+        
+        signature = self.file_signature()
+        if signature == self.signature:
+            return False
+        
+        try:
+            with open(self.config_path, 'r') as f:
+                config = json.load(f)
+        except (OSError, ValueError):
+            # Missing or half-written: keep running on the old config
+            return False
+        if not isinstance(config, dict):
+            return False
+        
+        # Config first, then a fresh memo: a get() racing the swap can only
+        # memoize into the memo that is being thrown away
+        self.config, self.values = config, {}
+        self.signature = signature
+        for callback in self.subscribers:
+            callback(self)
+        return True
     
     def load_config(self):
         if not self.config_path.exists():
@@ -24,13 +74,34 @@ class Config:
             "weather": {
                 "api_key": "",
                 "city": "London",
-                "units": "metric"
+                "units": "metric",
+                "calls_per_hour": 50
             },
             "crypto": {
-                "coins": ["bitcoin", "ethereum"]
+                "coins": ["bitcoin", "ethereum"],
+                "vs_currencies": ["usd"],
+                "top_n": 10,
+                "history_size": 1440
             },
             "focus_mode": {
-                "blocked_sites": ["facebook.com", "twitter.com", "youtube.com", "reddit.com"]
+                "blocked_sites": ["facebook.com", "twitter.com", "youtube.com", "reddit.com"],
+                "blocklist_file": None
+            },
+            "cache": {
+                "ttl": {
+                    "weather": 600,
+                    "crypto": 60
+                },
+                "max_bytes": 1048576,
+                "max_age": 604800
+            },
+            "http": {
+                "retries": 2,
+                "breaker_threshold": 3,
+                "breaker_cooldown": 60
+            },
+            "display": {
+                "low_bandwidth": False
             }
         }
         
@@ -53,10 +124,13 @@ class Config:
             "Enter your OpenWeatherMap API key", 
             default=self.config["weather"]["api_key"]
         )
-        self.config["weather"]["city"] = Prompt.ask(
-            "Enter your city", 
-            default=self.config["weather"]["city"]
+        cities = Prompt.ask(
+            "Enter your city (comma-separated for several)", 
+            default=",".join(self.config["weather"].get("cities") or [self.config["weather"]["city"]])
         )
+        cities = [city.strip() for city in cities.split(",") if city.strip()]
+        self.config["weather"]["city"] = cities[0]
+        self.config["weather"]["cities"] = cities
         
         # Crypto setup
         console.print("\nCryptocurrency Configuration", style="bold underline")
@@ -69,12 +143,25 @@ class Config:
         # Save configuration
         with open(self.config_path, 'w') as f:
             json.dump(self.config, f, indent=4)
+        self.values = {}
+        self.signature = self.file_signature()
         
         console.print("Configuration saved successfully!", style="green")
     
     def get(self, key, default=None):
-        keys = key.split('.')
+        # Resolved dotted keys are memoized until the next reload
+        try:
+            value = self.values[key]
+        except KeyError:
+            value = self.values[key] = self.resolve(key)
+        if value is _MISSING:
+            return default
+        return value
+    
+    def resolve(self, key):
         value = self.config
-        for k in keys:
-            value = value.get(k, {})
-        return value if value != {} else default
\ No newline at end of file
+        for k in key.split('.'):
+            if not isinstance(value, dict) or k not in value:
+                return _MISSING
+            value = value[k]
+        return value
\ No newline at end of file
@@ -1,45 +1,165 @@
 # crypto.py
+import heapq
+import math
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
-from rich.console import Console
+
+from http_client import CircuitBreaker, CircuitOpenError, get_json
+
+CURRENCY_SYMBOLS = {"usd": "$", "eur": "€", "gbp": "£", "jpy": "¥", "btc": "₿", "eth": "Ξ"}
+
+class PriceTable:
+    # Columnar prices: one float array per quote currency, rows keyed by coin id.
+    # Missing values are NaN so every column stays the same length.
+    def __init__(self, coins, currencies):
+        self.ids = list(coins)
+        self.currencies = list(currencies)
+        self.index = {coin: row for row, coin in enumerate(self.ids)}
+        self.prices = {currency: array('d', [math.nan]) * len(self.ids) for currency in self.currencies}
+        self.changes = {currency: array('d', [math.nan]) * len(self.ids) for currency in self.currencies}
+    
+    def update(self, data):
+        for coin, values in data.items():
+            row = self.index.get(coin)
+            if row is None:
+                continue
+            for currency in self.currencies:
+                price = values.get(currency)
+                change = values.get(f"{currency}_24h_change")
+                self.prices[currency][row] = math.nan if price is None else price
+                self.changes[currency][row] = math.nan if change is None else change
+    
+    def get(self, coin, currency=None):
+        currency = currency or self.currencies[0]
+        row = self.index[coin]
+        return self.prices[currency][row], self.changes[currency][row]
+    
+    def rows(self, currency=None):
+        currency = currency or self.currencies[0]
+        prices = self.prices[currency]
+        changes = self.changes[currency]
+        for row, coin in enumerate(self.ids):
+            if not math.isnan(prices[row]):
+                yield coin, prices[row], changes[row]
+    
+    def top_movers(self, n, currency=None):
+        # Largest absolute 24h change first; coins without a change sort last
+        return heapq.nlargest(
+            n, self.rows(currency),
+            key=lambda row: -1.0 if math.isnan(row[2]) else abs(row[2])
+        )
+    
+    def to_dict(self):
+        # JSON-friendly snapshot for the response cache and --json output
+        def values(column):
+            return [None if math.isnan(value) else value for value in column]
+        return {
+            "ids": self.ids,
+            "currencies": self.currencies,
+            "prices": {currency: values(column) for currency, column in self.prices.items()},
+            "changes": {currency: values(column) for currency, column in self.changes.items()},
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        table = cls(data["ids"], data["currencies"])
+        for currency in table.currencies:
+            table.prices[currency] = array('d', (math.nan if v is None else v for v in data["prices"][currency]))
+            table.changes[currency] = array('d', (math.nan if v is None else v for v in data["changes"][currency]))
+        return table
+
+def display_name(coin):
+    return coin.replace("-", " ").title()
+
+def format_price(price, currency):
+    symbol = CURRENCY_SYMBOLS.get(currency)
+    if symbol:
+        return f"{symbol}{price:,.2f}" if price >= 1 else f"{symbol}{price:,.6g}"
+    return f"{price:,.4g} {currency.upper()}"
 
 class CryptoAPI:
-    def __init__(self, config):
+    def __init__(self, config, history=None):
         self.config = config
+        # Optional PriceHistory that receives a sample per coin on every successful fetch
+        self.history = history
         self.base_url = "https://api.coingecko.com/api/v3"
-        self.coins = self.config.get("crypto.coins", ["bitcoin", "ethereum"])
-        self.console = Console()
+        self._console = None
+        self.breaker = CircuitBreaker()
+        self.apply_config(config)
+        config.subscribe(self.apply_config)
+        self.table = PriceTable(self.coins, self.vs_currencies)
+        # Served while the circuit is open
+        self.last_result = None
     
-    def get_crypto_prices(self):
+    def apply_config(self, config):
+        # Runs again on every config reload; the next fetch rebuilds the
+        # table if the coins or currencies changed
+        self.coins = config.get("crypto.coins", ["bitcoin", "ethereum"])
+        self.vs_currencies = config.get("crypto.vs_currencies", ["usd"])
+        # CoinGecko ids average ~12 characters; 100 per request keeps URLs well under 2 KB
+        self.batch_size = config.get("crypto.batch_size", 100)
+        self.max_workers = config.get("crypto.max_workers", 8)
+        self.retries = config.get("http.retries", 2)
+        self.breaker.failure_threshold = config.get("http.breaker_threshold", 3)
+        self.breaker.cooldown = config.get("http.breaker_cooldown", 60)
+    
+    @property
+    def console(self):
+        # rich is only needed once there is an error to report
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console(stderr=True)
+        return self._console
+    
+    @property
+    def cache_key(self):
+        return "crypto:" + ",".join(self.vs_currencies) + ":" + ",".join(self.coins)
+    
+    def _fetch_chunk(self, coins):
+        params = {
+            "ids": ",".join(coins),
+            "vs_currencies": ",".join(self.vs_currencies),
+            "include_24hr_change": "true"
+        }
         try:
-            coin_ids = ",".join(self.coins)
-            params = {
-                "ids": coin_ids,
-                "vs_currencies": "usd",
-                "include_24hr_change": "true"
-            }
-            
-            response = requests.get(
-                f"{self.base_url}/simple/price",
-                params=params,
-                timeout=10
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            result = {}
-            
-            for coin in self.coins:
-                if coin in data:
-                    result[coin.title()] = {
-                        "price": data[coin]["usd"],
-                        "change_24h": data[coin]["usd_24h_change"]
-                    }
-            
-            return result
-            
+            return get_json(f"{self.base_url}/simple/price", params, self.breaker, retries=self.retries), None
         except requests.exceptions.RequestException as e:
-            self.console.print(f"Crypto API error: {e}", style="red")
-            return None
-        except KeyError as e:
-            self.console.print(f"Crypto data parsing error: {e}", style="red")
-            return None
\ No newline at end of file
+            return None, e
+    
+    def get_crypto_prices(self):
+        if self.table.ids != self.coins or self.table.currencies != self.vs_currencies:
+            self.table = PriceTable(self.coins, self.vs_currencies)
+        
+        chunks = [self.coins[i:i + self.batch_size] for i in range(0, len(self.coins), self.batch_size)]
+        if len(chunks) <= 1:
+            responses = [self._fetch_chunk(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as pool:
+                responses = list(pool.map(self._fetch_chunk, chunks))
+        
+        errors = [error for _, error in responses if error is not None]
+        # Coins this fetch actually returned; rows from failed batches are stale
+        fresh = set()
+        for data, _ in responses:
+            if data is not None:
+                try:
+                    self.table.update(data)
+                    fresh.update(data)
+                except (AttributeError, TypeError) as e:
+                    errors.append(e)
+        
+        reportable = [error for error in errors if not isinstance(error, CircuitOpenError)]
+        if reportable:
+            self.console.print(f"Crypto API error: {reportable[0]}", style="red")
+        if errors and len(errors) >= len(chunks):
+            # Nothing new arrived; an open circuit still serves the last good table
+            return None if reportable else self.last_result
+        
+        if self.history is not None:
+            self.history.record(time.time(), ((coin, price) for coin, price, _ in self.table.rows() if coin in fresh))
+        
+        self.last_result = self.table.to_dict()
+        return self.last_result
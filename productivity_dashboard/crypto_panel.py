@@ -0,0 +1,70 @@
+# crypto_panel.py
+from rich.panel import Panel
+from rich.text import Text
+
+from crypto import CryptoAPI, PriceTable, display_name, format_price
+from instrumentation import stats
+from panels import DashboardPanel
+from price_history import PriceHistory
+
+class CryptoPanel(DashboardPanel):
+    interval = 60
+    source = "crypto"
+
+    def __init__(self, dashboard):
+        super().__init__(dashboard)
+        config = dashboard.config
+        self.history = PriceHistory(capacity=config.get("crypto.history_size", 1440))
+        self.history.load()
+        self.api = CryptoAPI(config, history=self.history)
+        stats.register(self.api, ["get_crypto_prices"], "http")
+
+    def start(self, loop):
+        loop.call_every(300, self.save_history)
+
+    def fetch(self):
+        config = self.dashboard.config
+        return self.dashboard.cache.fetch(self.api.cache_key, self.cache_ttl(config.get("cache.ttl.crypto", 60)), self.api.get_crypto_prices)
+
+    def seed(self):
+        return self.dashboard.cache.load(self.api.cache_key)[0]
+
+    def render(self):
+        fetcher = self.dashboard.fetcher
+        crypto_data = fetcher.get("crypto")
+        if not crypto_data:
+            if fetcher.is_pending("crypto"):
+                return Panel("Fetching prices...", title="Cryptocurrency", border_style="cyan")
+            return Panel("Crypto data unavailable", title="Cryptocurrency", border_style="red")
+
+        table = PriceTable.from_dict(crypto_data)
+        currency = table.currencies[0]
+        top_n = self.dashboard.config.get("crypto.top_n", 10)
+        movers = table.top_movers(top_n, currency)
+
+        crypto_text = Text()
+        for coin, price, change in movers:
+            crypto_text.append(f"{display_name(coin)}: {format_price(price, currency)}", style="bold")
+            if change == change:  # NaN when CoinGecko has no 24h change
+                change_style = "green" if change >= 0 else "red"
+                crypto_text.append(f" ({change:+.2f}%)", style=change_style)
+
+            history = self.history.get(coin)
+            if history is not None and len(history) > 1:
+                crypto_text.append(f" {history.sparkline(12)}", style="cyan")
+                crypto_text.append(f" vol {history.volatility:.1f}%", style="dim")
+            crypto_text.append("\n")
+
+        title = "Cryptocurrency"
+        if len(table.ids) > top_n:
+            title = f"Cryptocurrency (top {len(movers)} movers of {len(table.ids)})"
+        return Panel(crypto_text, title=title, border_style="cyan")
+
+    def save_history(self):
+        # Only an instance that recorded new samples writes, so idle dashboards
+        # sharing the cache don't overwrite a fresher file
+        if self.history.dirty:
+            self.history.save()
+
+    def close(self):
+        self.save_history()
@@ -0,0 +1,292 @@
+# daemon.py
+# Optional background process that fetches once for every dashboard on the
+# machine. Clients connect over a UNIX socket and receive newline-delimited
+# JSON messages:
+#   {"type": "update", "source": "weather", "data": ...}  latest data for a source
+#                                                         ("snapshot": true when sent on connect)
+#   {"type": "tasks", "version": 7}                       tasks.db changed
+# A dashboard that finds no daemon fetches in-process as before.
+import json
+import os
+import select
+import signal
+import socket
+import sys
+import time
+from pathlib import Path
+
+from event_loop import EventLoop
+
+SOURCES = ("weather", "crypto")
+
+def default_socket_path():
+    return Path.home() / ".productivity_dashboard" / "daemon.sock"
+
+def encode(message):
+    return (json.dumps(message) + "\n").encode("utf-8")
+
+class FetchDaemon:
+    def __init__(self, path=None, config=None, refresh_interval=30):
+        from cache import ResponseCache
+        from config import Config
+        from crypto import CryptoAPI
+        from database import TaskManager
+        from fetcher import BackgroundFetcher
+        from weather import WeatherAPI
+
+        self.path = Path(path) if path else default_socket_path()
+        self.config = config or Config()
+        self.refresh_interval = refresh_interval
+        self.task_manager = TaskManager()
+        self.cache = ResponseCache(
+            max_bytes=self.config.get("cache.max_bytes", 1024 * 1024),
+            max_age=self.config.get("cache.max_age", 7 * 24 * 3600)
+        )
+        self.weather_api = WeatherAPI(self.config, self.cache)
+        # Clients keep their own price history from the updates they receive
+        self.crypto_api = CryptoAPI(self.config)
+        self.fetcher = BackgroundFetcher({
+            "weather": lambda: self.cache.fetch(
+                self.weather_api.cache_key, self.config.get("cache.ttl.weather", 600), self.weather_api.get_weather
+            ),
+            "crypto": lambda: self.cache.fetch(
+                self.crypto_api.cache_key, self.config.get("cache.ttl.crypto", 60), self.crypto_api.get_crypto_prices
+            ),
+        })
+        for source, api in (("weather", self.weather_api), ("crypto", self.crypto_api)):
+            self.fetcher.seed(source, self.cache.load(api.cache_key)[0])
+
+        self.server = None
+        self.clients = set()
+        self.tasks_token = self.task_manager.change_token()
+        self.tasks_version = 0
+        self.loop = None
+
+    def listen(self):
+        # Returns False if another daemon already owns the socket
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists():
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(str(self.path))
+                return False
+            except OSError:
+                # Left behind by a daemon that didn't shut down cleanly
+                self.path.unlink()
+            finally:
+                probe.close()
+
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.server.bind(str(self.path))
+        os.chmod(self.path, 0o600)
+        self.server.listen(64)
+        self.server.setblocking(False)
+        return True
+
+    def on_accept(self, server):
+        try:
+            client, _ = server.accept()
+        except (BlockingIOError, OSError):
+            return
+        # A client that can't take a message within a second is dropped
+        # rather than allowed to stall every other dashboard
+        client.settimeout(1.0)
+        self.clients.add(client)
+        self.loop.add_reader(client, self.on_client_data)
+
+        snapshot = [
+            {"type": "update", "source": source, "data": self.fetcher.get(source), "snapshot": True}
+            for source in SOURCES if self.fetcher.get(source) is not None
+        ]
+        snapshot.append({"type": "tasks", "version": self.tasks_version})
+        self.send(client, b"".join(encode(message) for message in snapshot))
+
+    def on_client_data(self, client):
+        # Clients never send anything; readable means they hung up
+        try:
+            data = client.recv(4096)
+        except OSError:
+            data = b""
+        if not data:
+            self.drop(client)
+
+    def drop(self, client):
+        if client in self.clients:
+            self.clients.discard(client)
+            self.loop.remove_reader(client)
+            client.close()
+
+    def send(self, client, payload):
+        try:
+            client.sendall(payload)
+        except OSError:
+            self.drop(client)
+
+    def broadcast(self, message):
+        payload = encode(message)
+        for client in list(self.clients):
+            self.send(client, payload)
+
+    def on_fetch_update(self):
+        for source in self.fetcher.pop_updated():
+            data = self.fetcher.get(source)
+            if data is not None:
+                self.broadcast({"type": "update", "source": source, "data": data})
+
+    def on_tasks_timer(self):
+        # One data_version check for every attached dashboard
+        token = self.task_manager.change_token()
+        if token != self.tasks_token:
+            self.tasks_token = token
+            self.tasks_version += 1
+            self.broadcast({"type": "tasks", "version": self.tasks_version})
+
+    def on_refresh_timer(self):
+        self.config.reload_if_changed()
+        self.fetcher.refresh()
+
+    def on_error(self, error):
+        print(f"Daemon error: {error}", file=sys.stderr)
+
+    def start(self):
+        # Binds the socket and arms the loop; run() then serves until stopped
+        if not self.listen():
+            return False
+
+        self.loop = EventLoop(on_error=self.on_error)
+        self.fetcher.on_update = self.loop.wakeup
+        self.loop.on_wakeup(self.on_fetch_update)
+        self.loop.add_reader(self.server, self.on_accept)
+        self.loop.call_every(self.refresh_interval, self.on_refresh_timer, delay=0)
+        self.loop.call_every(1, self.on_tasks_timer)
+        return True
+
+    def run(self):
+        if not self.start():
+            print(f"A daemon is already running on {self.path}", file=sys.stderr)
+            return False
+
+        # `kill` should remove the socket just like Ctrl-C
+        signal.signal(signal.SIGTERM, lambda signum, frame: (self.loop.stop(), self.loop.wakeup()))
+        print(f"Serving dashboard updates on {self.path}", file=sys.stderr)
+        try:
+            self.loop.run()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+        return True
+
+    def close(self):
+        for client in list(self.clients):
+            self.drop(client)
+        if self.loop is not None:
+            self.loop.close()
+        if self.server is not None:
+            self.server.close()
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+        self.fetcher.shutdown()
+        self.task_manager.close()
+
+class DaemonClient:
+    # Stands in for BackgroundFetcher in the dashboard: same get/version/
+    # pop_updated interface, but the data is pushed by the daemon
+    def __init__(self, sock, history=None):
+        self.sock = sock
+        self.sock.setblocking(False)
+        self.history = history
+        self.buffer = b""
+        self.results = {}
+        self.versions = {}
+        self.updated = set()
+        self.tasks_version = 0
+        self.on_update = None
+
+    @classmethod
+    def connect(cls, path=None, history=None):
+        # None when no daemon is listening
+        path = Path(path) if path else default_socket_path()
+        if not hasattr(socket, "AF_UNIX") or not path.exists():
+            return None
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(str(path))
+        except OSError:
+            sock.close()
+            return None
+
+        # The daemon sends a snapshot straight away; wait briefly for it so
+        # the first paint isn't empty
+        client = cls(sock, history)
+        select.select([sock], [], [], 0.5)
+        if not client.read():
+            client.shutdown()
+            return None
+        return client
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def read(self):
+        # Applies every complete message; False once the daemon has gone away
+        try:
+            while True:
+                chunk = self.sock.recv(65536)
+                if not chunk:
+                    return False
+                self.buffer += chunk
+        except BlockingIOError:
+            pass
+        except OSError:
+            return False
+
+        *lines, self.buffer = self.buffer.split(b"\n")
+        for line in lines:
+            try:
+                self.apply(json.loads(line))
+            except (ValueError, KeyError, TypeError):
+                continue
+        return True
+
+    def apply(self, message):
+        if message["type"] == "tasks":
+            self.tasks_version = message["version"]
+            return
+
+        source = message["source"]
+        self.results[source] = message["data"]
+        self.versions[source] = self.versions.get(source, 0) + 1
+        self.updated.add(source)
+
+        # Record fresh prices the way CryptoAPI does in-process; the snapshot
+        # sent on connect may be old, so it isn't sampled
+        if source == "crypto" and self.history is not None and not message.get("snapshot"):
+            from crypto import PriceTable
+            table = PriceTable.from_dict(message["data"])
+            self.history.record(time.time(), ((coin, price) for coin, price, _ in table.rows()))
+
+    def refresh(self, names=None):
+        # The daemon keeps its own schedule
+        pass
+
+    def seed(self, name, value):
+        pass
+
+    def version(self, name):
+        return self.versions.get(name, 0)
+
+    def get(self, name):
+        return self.results.get(name)
+
+    def is_pending(self, name):
+        return False
+
+    def pop_updated(self):
+        updated, self.updated = self.updated, set()
+        return updated
+
+    def shutdown(self):
+        self.sock.close()
@@ -1,15 +1,6 @@
 # dashboard.py
-import json
 import time
-import argparse
-from datetime import datetime
-from rich.console import Console
 from rich.layout import Layout
-from rich.panel import Panel
-from rich.table import Table
-from rich.live import Live
-from rich.text import Text
-from rich import box
 import sys
 import os
 
@@ -18,23 +9,51 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from config import Config
 from database import TaskManager
-from weather import WeatherAPI
-from crypto import CryptoAPI
-from focus_timer import FocusTimer
-from focus_mode import FocusMode
-
-console = Console()
+from fetcher import BackgroundFetcher
+from cache import ResponseCache
+from daemon import DaemonClient
+from diff_live import DiffLive
+from event_loop import EventLoop
+from instrumentation import stats
+from panels import BUILTIN_PANELS, console, create_panels
+import terminal_input
 
 class ProductivityDashboard:
-    def __init__(self):
+    def __init__(self, low_bandwidth=False):
         self.config = Config()
+        self.low_bandwidth = low_bandwidth
+        self.live = None
+        self.loop = None
+        self.last_redraw = 0
+        self.redraw_handle = None
+        self.input_timer = None
+        self.apply_display_config()
         self.task_manager = TaskManager()
-        self.weather_api = WeatherAPI(self.config)
-        self.crypto_api = CryptoAPI(self.config)
-        self.focus_timer = FocusTimer()
-        self.focus_mode = FocusMode()
+        self.cache = ResponseCache(
+            max_bytes=self.config.get("cache.max_bytes", 1024 * 1024),
+            max_age=self.config.get("cache.max_age", 7 * 24 * 3600)
+        )
         self.layout = Layout()
-        self.last_update = 0
+        self.panel_tokens = {}
+        
+        # Only enabled panels are imported; each brings its own data source
+        self.panels = create_panels(self, self.config)
+        self.local_fetcher = BackgroundFetcher({
+            panel.source: panel.fetch for panel in self.panels.values() if panel.source is not None
+        })
+        
+        # Paint from disk immediately, even if stale; refresh revalidates it
+        for panel in self.fetch_panels():
+            self.local_fetcher.seed(panel.source, panel.seed())
+        # Swapped for a DaemonClient while a fetch daemon is running
+        self.fetcher = self.local_fetcher
+        self.daemon = None
+        self.config.subscribe(self.apply_config)
+        
+        stats.register(self.task_manager, [
+            "get_tasks", "count_tasks", "search", "add_task", "complete_task", "delete_task", "change_token",
+            "get_stats"
+        ], "db")
         
     def setup_layout(self):
         # Divide the layout into sections
@@ -53,195 +72,240 @@ class ProductivityDashboard:
         # Divide the left section
         self.layout["left"].split(
             Layout(name="tasks"),
-            Layout(name="timer")
+            Layout(name="summary")
         )
-        
-        # Divide the right section
-        self.layout["right"].split(
-            Layout(name="weather"),
-            Layout(name="crypto")
+        self.layout["summary"].split_row(
+            Layout(name="timer"),
+            Layout(name="stats")
         )
-    
-    def update_header(self):
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        header_text = Text(f"Productivity Dashboard | {current_time}", style="bold blue")
-        return Panel(header_text, style="white")
-    
-    def update_tasks(self):
-        tasks = self.task_manager.get_tasks()
-        table = Table(show_header=True, header_style="bold magenta", box=box.ROUNDED)
-        table.add_column("ID", style="dim", width=4)
-        table.add_column("Task", min_width=20)
-        table.add_column("Priority", justify="right")
-        table.add_column("Status", justify="center")
-        
-        for task in tasks:
-            priority_style = "red" if task["priority"] == "High" else "yellow" if task["priority"] == "Medium" else "green"
-            status_style = "green" if task["completed"] else "red"
-            status_text = "✓" if task["completed"] else "✗"
-            
-            table.add_row(
-                str(task["id"]),
-                task["description"],
-                f"[{priority_style}]{task['priority']}[/{priority_style}]",
-                f"[{status_style}]{status_text}[/{status_style}]"
-            )
-            
-        return Panel(table, title="Tasks", border_style="green")
-    
-    def update_weather(self):
-        weather_data = self.weather_api.get_weather()
-        if not weather_data:
-            return Panel("Weather data unavailable", title="Weather", border_style="red")
         
-        weather_text = Text()
-        weather_text.append(f"Location: {weather_data['city']}\n", style="bold")
-        weather_text.append(f"Temperature: {weather_data['temperature']}°C\n")
-        weather_text.append(f"Condition: {weather_data['description']}\n")
-        weather_text.append(f"Humidity: {weather_data['humidity']}%\n")
-        weather_text.append(f"Wind: {weather_data['wind_speed']} km/h")
+        # Divide the right section; plugin panels stack below the built-in ones
+        right = ["weather", "crypto"] + [name for name in self.panels if name not in BUILTIN_PANELS] + ["latency"]
+        self.layout["right"].split(*[Layout(name=name) for name in right])
+        self.layout["latency"].visible = False
         
-        return Panel(weather_text, title="Weather", border_style="yellow")
+        # Innermost first, for show_regions()
+        self.splits = [
+            ("summary", ["timer", "stats"]),
+            ("left", ["tasks", "summary"]),
+            ("right", right),
+            ("main", ["left", "right"]),
+        ]
+        for name in BUILTIN_PANELS:
+            if name not in self.panels:
+                self.layout[name].visible = False
+        self.show_regions()
     
-    def update_crypto(self):
-        crypto_data = self.crypto_api.get_crypto_prices()
-        if not crypto_data:
-            return Panel("Crypto data unavailable", title="Cryptocurrency", border_style="red")
-        
-        crypto_text = Text()
-        for coin, data in crypto_data.items():
-            crypto_text.append(f"{coin}: ${data['price']:,.2f}", style="bold")
-            change_style = "green" if data['change_24h'] >= 0 else "red"
-            crypto_text.append(f" ({data['change_24h']:+.2f}%)\n", style=change_style)
-        
-        return Panel(crypto_text, title="Cryptocurrency", border_style="cyan")
+    def show_regions(self):
+        # A split is shown while any of its regions is, so disabled panels
+        # give their space to the rest
+        for split, regions in self.splits:
+            self.layout[split].visible = any(self.layout[name].visible for name in regions)
     
-    def update_timer(self):
-        timer_status = self.focus_timer.get_status()
-        
-        timer_text = Text()
-        timer_text.append(f"Mode: {timer_status['mode']}\n", style="bold")
-        timer_text.append(f"Time: {timer_status['time_remaining']}\n")
-        timer_text.append(f"Session: {timer_status['sessions_completed']}/4\n")
-        
-        focus_status = "Active" if self.focus_mode.is_active else "Inactive"
-        focus_style = "green" if self.focus_mode.is_active else "red"
-        timer_text.append(f"Focus Mode: [{focus_style}]{focus_status}[/{focus_style}]")
-        
-        return Panel(timer_text, title="Focus Timer", border_style="magenta")
+    def fetch_panels(self):
+        return [panel for panel in self.panels.values() if panel.source is not None]
     
-    def update_footer(self):
-        footer_text = Text("Commands: (a)dd task, (d)elete task, (c)omplete task, (t)imer control, (f)ocus mode, (q)uit")
-        return Panel(footer_text, style="white")
+    def update_panel(self, panel):
+        return self.refresh_panel(panel.name, panel.token(), panel.render)
+    
+    def refresh_panel(self, name, token, build):
+        # Rebuild a region only when its token changed; otherwise the Layout
+        # keeps rendering the previous renderable
+        if name in self.panel_tokens and self.panel_tokens[name] == token:
+            return False
+        self.layout[name].update(build())
+        self.panel_tokens[name] = token
+        return True
+    
+    def fetch_token(self, source):
+        return self.fetcher.version(source), self.fetcher.is_pending(source)
+    
+    def change_token(self):
+        # With a daemon attached, its tasks feed replaces polling data_version
+        if self.daemon is not None:
+            return self.daemon.tasks_version, self.task_manager.write_count
+        return self.task_manager.change_token()
     
     def refresh_dashboard(self):
-        self.layout["header"].update(self.update_header())
-        self.layout["tasks"].update(self.update_tasks())
-        self.layout["weather"].update(self.update_weather())
-        self.layout["crypto"].update(self.update_crypto())
-        self.layout["timer"].update(self.update_timer())
-        self.layout["footer"].update(self.update_footer())
-        
+        # Network fetches run in the background; panels show the last good data
+        self.fetcher.refresh()
+        self.refresh_panels()
         return self.layout
     
+    def refresh_panels(self, panels=None):
+        if panels is None:
+            panels = self.panels.values()
+        changed = [self.update_panel(panel) for panel in panels]
+        return any(changed)
+    
     def handle_input(self, key):
         if key == "q":
             return False
-        elif key == "a":
-            self.add_task()
-        elif key == "d":
-            self.delete_task()
-        elif key == "c":
-            self.complete_task()
-        elif key == "t":
-            self.control_timer()
-        elif key == "f":
-            self.toggle_focus_mode()
+        for panel in self.panels.values():
+            if panel.handle_key(key):
+                break
         return True
     
-    def add_task(self):
-        description = console.input("Enter task description: ")
-        priority = console.input("Priority (High/Medium/Low) [Medium]: ") or "Medium"
-        self.task_manager.add_task(description, priority)
+    def apply_display_config(self):
+        # display.low_bandwidth (or --low-bandwidth) diffs frames and implies a
+        # one-second redraw floor and a minute clock; both can be set directly
+        low_bandwidth = self.low_bandwidth or self.config.get("display.low_bandwidth", False)
+        self.diff_render = bool(low_bandwidth)
+        self.min_redraw_interval = self.config.get("display.min_redraw_interval", 1 if low_bandwidth else 0)
+        clock = self.config.get("display.clock", "minutes" if low_bandwidth else "seconds")
+        self.clock_format = "%Y-%m-%d %H:%M" if clock == "minutes" else "%Y-%m-%d %H:%M:%S"
+        if self.live is not None:
+            self.live.diff = self.diff_render
+            self.live.invalidate()
     
-    def delete_task(self):
-        task_id = console.input("Enter task ID to delete: ")
-        try:
-            self.task_manager.delete_task(int(task_id))
-        except ValueError:
-            console.print("Invalid task ID", style="red")
+    def apply_config(self, config):
+        # config.json changed on disk; the API clients have already picked it up.
+        # Enabling, disabling or re-timing panels takes a restart.
+        for panel in self.panels.values():
+            panel.apply_config(config)
+        self.apply_display_config()
+        # Settings like crypto.top_n affect rendering, so rebuild every panel
+        self.panel_tokens.clear()
+        self.fetcher.refresh()
     
-    def complete_task(self):
-        task_id = console.input("Enter task ID to complete: ")
-        try:
-            self.task_manager.complete_task(int(task_id))
-        except ValueError:
-            console.print("Invalid task ID", style="red")
+    def on_config_timer(self):
+        if self.config.reload_if_changed():
+            self.on_tick()
+    
+    def on_tick(self):
+        # Cheap change checks for panels without an interval of their own;
+        # repaint only if one changed
+        if self.refresh_panels([panel for panel in self.panels.values() if panel.interval is None]):
+            self.redraw()
+    
+    def on_panel_timer(self, panel):
+        if panel.source is not None and self.daemon is None:
+            self.attach_daemon()
+        panel.refresh()
+        if self.update_panel(panel):
+            self.redraw()
+    
+    def redraw(self):
+        # Repaints closer together than display.min_redraw_interval are
+        # coalesced into one at the end of the interval
+        if self.redraw_handle is not None:
+            return
+        wait = self.last_redraw + self.min_redraw_interval - time.monotonic()
+        if wait > 0:
+            self.redraw_handle = self.loop.call_later(wait, self.on_redraw_timer)
+            return
+        self.last_redraw = time.monotonic()
+        self.live.refresh()
+    
+    def on_redraw_timer(self):
+        self.redraw_handle = None
+        self.redraw()
+    
+    def attach_daemon(self):
+        crypto = self.panels.get("crypto")
+        daemon = DaemonClient.connect(history=crypto.history if crypto is not None else None)
+        if daemon is None:
+            return False
+        self.daemon = daemon
+        self.fetcher = daemon
+        self.loop.add_reader(daemon, self.on_daemon_data)
+        self.panel_tokens.clear()
+        return True
     
-    def control_timer(self):
-        console.print("Timer controls: (s)tart, (p)ause, (r)eset, (b)reak")
-        action = console.input("Action: ").lower()
+    def detach_daemon(self):
+        # The daemon went away: fetch in-process again
+        self.loop.remove_reader(self.daemon)
+        self.daemon.shutdown()
+        self.daemon = None
+        self.fetcher = self.local_fetcher
+        self.panel_tokens.clear()
+        self.fetcher.refresh()
+    
+    def on_daemon_data(self, daemon):
+        if not daemon.read():
+            self.detach_daemon()
+        self.on_tick()
+        self.on_fetch_update()
+    
+    def on_fetch_update(self):
+        # Swap in fetched data as soon as each source completes
+        updated = self.fetcher.pop_updated()
+        if self.refresh_panels([panel for panel in self.fetch_panels() if panel.source in updated]):
+            self.redraw()
+    
+    def on_keys(self, keys):
+        if keys is None:
+            # stdin closed; keep the dashboard running without input
+            if self.input_timer is not None:
+                self.loop.cancel(self.input_timer)
+                self.input_timer = None
+            else:
+                self.loop.remove_reader(sys.stdin)
+            return
         
-        if action == "s":
-            self.focus_timer.start()
-        elif action == "p":
-            self.focus_timer.pause()
-        elif action == "r":
-            self.focus_timer.reset()
-        elif action == "b":
-            self.focus_timer.start_break()
-    
-    def toggle_focus_mode(self):
-        if self.focus_mode.is_active:
-            self.focus_mode.disable()
-            console.print("Focus mode disabled", style="red")
-        else:
-            self.focus_mode.enable()
-            console.print("Focus mode enabled", style="green")
+        for key in keys:
+            with terminal_input.cooked():
+                keep_running = self.handle_input(key.lower())
+            if not keep_running:
+                self.loop.stop()
+                return
+        # Prompts print over the screen, so repaint even if no panel changed
+        self.refresh_panels()
+        self.redraw()
+    
+    def on_error(self, error):
+        console.print(f"Error: {error}", style="red")
     
     def run(self):
         self.setup_layout()
+        self.loop = EventLoop(on_error=self.on_error)
+        self.local_fetcher.on_update = self.loop.wakeup
+        if self.fetch_panels():
+            self.attach_daemon()
+        self.loop.on_wakeup(self.on_fetch_update)
+        
+        # Each panel refreshes on its own interval (weather every 10 minutes,
+        # crypto every minute, clock and timer every second); the rest are
+        # checked for changes every second
+        for panel in self.panels.values():
+            panel.start(self.loop)
+            if panel.interval:
+                self.loop.call_every(panel.interval, lambda panel=panel: self.on_panel_timer(panel))
+        self.loop.call_every(1, self.on_tick)
+        self.loop.call_every(self.config.check_interval, self.on_config_timer)
         
-        with Live(self.refresh_dashboard(), refresh_per_second=1, screen=True) as live:
-            while True:
-                try:
-                    # Refresh data every 30 seconds
-                    current_time = time.time()
-                    if current_time - self.last_update > 30:
-                        live.update(self.refresh_dashboard())
-                        self.last_update = current_time
-                    
-                    # Check for user input with a timeout
-                    try:
-                        # Use a non-blocking input approach
-                        import select
-                        import sys
-                        
-                        if select.select([sys.stdin], [], [], 0.1)[0]:
-                            key = sys.stdin.readline().strip().lower()
-                            if key and not self.handle_input(key):
-                                break
-                    except (ImportError, Exception):
-                        # Fallback for Windows or other systems without select
-                        time.sleep(0.1)
-                        
-                except KeyboardInterrupt:
-                    break
-                except Exception as e:
-                    console.print(f"Error: {e}", style="red")
-                    time.sleep(1)
+        if terminal_input.supports_cbreak():
+            self.loop.add_reader(sys.stdin, lambda stream: self.on_keys(terminal_input.read_keys(stream)))
+        elif terminal_input.msvcrt is not None:
+            self.loop.call_every(0.1, lambda: self.on_keys(terminal_input.poll_keys()))
+        elif sys.stdin is not None:
+            # Piped or redirected stdin: one command per line
+            try:
+                self.loop.add_reader(sys.stdin, lambda stream: self.on_keys(terminal_input.read_line(stream)))
+            except (PermissionError, ValueError):
+                # epoll can't watch a regular file, but reading one never blocks
+                self.input_timer = self.loop.call_every(0.1, lambda: self.on_keys(terminal_input.read_line()))
+        
+        try:
+            with DiffLive(
+                self.refresh_dashboard(), auto_refresh=False, screen=True, diff=self.diff_render
+            ) as live, terminal_input.cbreak():
+                self.live = live
+                self.loop.run()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.loop.close()
+            self.local_fetcher.shutdown()
+            if self.daemon is not None:
+                self.daemon.shutdown()
+            for panel in self.panels.values():
+                panel.close()
 
 def main():
-    parser = argparse.ArgumentParser(description="Intelligent CLI Productivity Dashboard")
-    parser.add_argument("--setup", action="store_true", help="Run initial setup")
-    args = parser.parse_args()
-    
-    dashboard = ProductivityDashboard()
-    
-    if args.setup:
-        dashboard.config.setup()
-    else:
-        dashboard.run()
+    # The CLI decides what to load; the dashboard itself is just its default command
+    from cli import main as cli_main
+    cli_main()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,20 +1,54 @@
 # database.py
 import sqlite3
 import json
+import threading
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime, timedelta, timezone
 
-class TaskManager:
-    def __init__(self):
-        self.db_path = Path.home() / ".productivity_dashboard" / "tasks.db"
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.init_db()
-    
-    def init_db(self):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
+PRIORITY_RANKS = {"High": 3, "Medium": 2, "Low": 1}
+
+def format_duration(seconds):
+    # "45m", "3h 20m", "2d 4h"; "-" when there is nothing to average
+    if seconds is None:
+        return "-"
+    minutes = seconds // 60
+    if minutes < 60:
+        return f"{minutes}m"
+    hours, minutes = divmod(minutes, 60)
+    if hours < 24:
+        return f"{hours}h {minutes}m"
+    days, hours = divmod(hours, 24)
+    return f"{days}d {hours}h"
+
+def completion_seconds(row):
+    # Time from creation to completion; 0 when either timestamp is missing
+    return (
+        f"COALESCE(MAX(CAST((julianday({row}.completed_at) - julianday({row}.created_at)) * 86400 AS INTEGER), 0), 0)"
+    )
+
+def completion_upsert(row, sign=""):
+    # Adds (or with sign="-" removes) one completed task in its day's rollup
+    return f'''
+            INSERT INTO daily_completions (day, priority_rank, completed, completion_seconds)
+            VALUES (
+                date(COALESCE({row}.completed_at, {row}.created_at), 'localtime'), {row}.priority_rank,
+                {sign}1, {sign}{completion_seconds(row)}
+            )
+            ON CONFLICT (day, priority_rank) DO UPDATE SET
+                completed = completed + excluded.completed,
+                completion_seconds = completion_seconds + excluded.completion_seconds;'''
+
+# Rebuilds the focus rollups from the sessions table
+FOCUS_BACKFILL = '''
+        INSERT INTO daily_focus (day, sessions, focus_seconds)
+        SELECT date(ended_at, 'localtime'), COUNT(*), SUM(duration)
+        FROM sessions WHERE kind = 'focus' GROUP BY 1
+        '''
+
+# Each entry moves the schema up one PRAGMA user_version
+MIGRATIONS = [
+    [
+        '''
         CREATE TABLE IF NOT EXISTS tasks (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             description TEXT NOT NULL,
@@ -23,60 +57,451 @@ class TaskManager:
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             completed_at TIMESTAMP
         )
-        ''')
-        
-        conn.commit()
-        conn.close()
+        ''',
+    ],
+    [
+        "ALTER TABLE tasks ADD COLUMN priority_rank INTEGER NOT NULL DEFAULT 2",
+        # Older versions stored whatever was typed ("high", " low"); store it
+        # the way add_task() does now, then rank it
+        "UPDATE tasks SET priority = title_case(priority) WHERE priority IS NOT NULL",
+        '''
+        UPDATE tasks SET priority_rank = CASE lower(trim(priority))
+            WHEN 'high' THEN 3
+            WHEN 'low' THEN 1
+            ELSE 2
+        END
+        ''',
+        "CREATE INDEX IF NOT EXISTS idx_tasks_order ON tasks (completed, priority_rank, created_at)",
+    ],
+    [
+        # External-content FTS index over tasks.description, kept in sync by triggers
+        "CREATE VIRTUAL TABLE tasks_fts USING fts5(description, content='tasks', content_rowid='id', prefix='2 3')",
+        '''
+        CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN
+            INSERT INTO tasks_fts (rowid, description) VALUES (new.id, new.description);
+        END
+        ''',
+        '''
+        CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN
+            INSERT INTO tasks_fts (tasks_fts, rowid, description) VALUES ('delete', old.id, old.description);
+        END
+        ''',
+        '''
+        CREATE TRIGGER tasks_fts_update AFTER UPDATE OF description ON tasks BEGIN
+            INSERT INTO tasks_fts (tasks_fts, rowid, description) VALUES ('delete', old.id, old.description);
+            INSERT INTO tasks_fts (rowid, description) VALUES (new.id, new.description);
+        END
+        ''',
+        "INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')",
+    ],
+    [
+        # One row per focus timer phase that ran to its end
+        '''
+        CREATE TABLE IF NOT EXISTS sessions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT NOT NULL,
+            started_at TIMESTAMP NOT NULL,
+            ended_at TIMESTAMP NOT NULL,
+            duration INTEGER NOT NULL
+        )
+        ''',
+        "CREATE INDEX IF NOT EXISTS idx_sessions_ended ON sessions (ended_at)",
+    ],
+    [
+        # Per-day rollups, keyed by local date, so stats read a handful of
+        # rows however long the history is. Triggers keep them current;
+        # deleting a task or session later does not rewrite history.
+        '''
+        CREATE TABLE daily_completions (
+            day TEXT NOT NULL,
+            priority_rank INTEGER NOT NULL,
+            completed INTEGER NOT NULL DEFAULT 0,
+            completion_seconds INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, priority_rank)
+        ) WITHOUT ROWID
+        ''',
+        '''
+        CREATE TABLE daily_focus (
+            day TEXT PRIMARY KEY,
+            sessions INTEGER NOT NULL DEFAULT 0,
+            focus_seconds INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID
+        ''',
+        f'''
+        CREATE TRIGGER daily_completions_insert AFTER INSERT ON tasks WHEN new.completed BEGIN
+            {completion_upsert("new")}
+        END
+        ''',
+        f'''
+        CREATE TRIGGER daily_completions_complete AFTER UPDATE OF completed ON tasks
+        WHEN new.completed AND NOT old.completed BEGIN
+            {completion_upsert("new")}
+        END
+        ''',
+        f'''
+        CREATE TRIGGER daily_completions_uncomplete AFTER UPDATE OF completed ON tasks
+        WHEN old.completed AND NOT new.completed BEGIN
+            {completion_upsert("old", "-")}
+        END
+        ''',
+        '''
+        CREATE TRIGGER daily_focus_insert AFTER INSERT ON sessions WHEN new.kind = 'focus' BEGIN
+            INSERT INTO daily_focus (day, sessions, focus_seconds)
+            VALUES (date(new.ended_at, 'localtime'), 1, new.duration)
+            ON CONFLICT (day) DO UPDATE SET
+                sessions = sessions + 1,
+                focus_seconds = focus_seconds + excluded.focus_seconds;
+        END
+        ''',
+        # One-time backfill from existing rows
+        f'''
+        INSERT INTO daily_completions (day, priority_rank, completed, completion_seconds)
+        SELECT date(COALESCE(completed_at, created_at), 'localtime'), priority_rank, COUNT(*),
+            SUM({completion_seconds("tasks")})
+        FROM tasks WHERE completed GROUP BY 1, 2
+        ''',
+        FOCUS_BACKFILL,
+    ],
+    [
+        # Every dashboard sharing timer.json records the phase it saw end.
+        # Keep one row per phase, make later duplicates no-ops and recount
+        # the focus rollups without the extra rows.
+        "DELETE FROM sessions WHERE id NOT IN (SELECT MIN(id) FROM sessions GROUP BY kind, started_at)",
+        "CREATE UNIQUE INDEX idx_sessions_phase ON sessions (kind, started_at)",
+        "DELETE FROM daily_focus",
+        FOCUS_BACKFILL,
+    ],
+]
+
+TASK_COLUMNS = "id, description, priority, completed, created_at, completed_at, priority_rank"
+
+# sqlite3 hands back a fresh string per row; mapping the usual names to one
+# shared copy keeps "High" from being stored once per task
+PRIORITY_NAMES = {name: name for name in PRIORITY_RANKS}
+
+class Task:
+    # One tasks row. Slots instead of a dict per row: no per-instance dict,
+    # no repeated key strings. task["field"] still works, so tasks can be
+    # used as get_tasks() cursors.
+    __slots__ = ("id", "description", "priority", "completed", "created_at", "completed_at", "priority_rank")
+    
+    def __init__(self, row):
+        self.id, self.description, priority, completed, self.created_at, self.completed_at, self.priority_rank = row
+        self.priority = PRIORITY_NAMES.get(priority, priority)
+        self.completed = bool(completed)
+    
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key) from None
+    
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+    
+    def __repr__(self):
+        return f"Task({self.id}, {self.description!r}, {self.priority!r}, completed={self.completed})"
+
+class TaskManager:
+    def __init__(self, db_path=None):
+        self.db_path = Path(db_path) if db_path else Path.home() / ".productivity_dashboard" / "tasks.db"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.RLock()
+        self.write_count = 0
+        self.conn = self.connect()
+        self.init_db()
+    
+    def connect(self):
+        # One long-lived connection; sqlite3 keeps the prepared statements
+        # for our fixed SQL strings in its statement cache
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=5.0,
+            check_same_thread=False,
+            cached_statements=64
+        )
+        # WAL lets other dashboard instances read while we write
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+    
+    def change_token(self):
+        # data_version moves when another connection commits; write_count covers our own writes
+        with self.lock:
+            data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+            return data_version, self.write_count
+    
+    def close(self):
+        with self.lock:
+            self.conn.close()
+    
+    def init_db(self):
+        with self.lock:
+            version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+            if version >= len(MIGRATIONS):
+                return
+            
+            self.conn.create_function("title_case", 1, lambda text: text.strip().title(), deterministic=True)
+            # IMMEDIATE takes the write lock so two instances can't migrate at once
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+                for number in range(version, len(MIGRATIONS)):
+                    for statement in MIGRATIONS[number]:
+                        self.conn.execute(statement)
+                    self.conn.execute(f"PRAGMA user_version = {number + 1}")
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
     
     def add_task(self, description, priority="Medium"):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        priority = priority.strip().title()
+        rank = PRIORITY_RANKS.get(priority, 2)
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO tasks (description, priority, priority_rank) VALUES (?, ?, ?)",
+                (description, priority, rank)
+            )
+            self.write_count += 1
+    
+    def get_tasks(self, limit=None, after=None, include_completed=True, priority=None, before=None):
+        # Keyset pagination: pass the last task of the previous page as `after`,
+        # or the first task of the next page as `before` to page backwards.
+        # Pending tasks come first, each group ordered High -> Low, newest first.
+        tasks = []
+        phases = [0, 1] if include_completed else [0]
+        cursor = before if before is not None else after
+        if before is not None:
+            phases.reverse()
+        
+        for completed in phases:
+            if cursor is not None:
+                cursor_phase = int(cursor["completed"])
+                if (before is None and cursor_phase > completed) or (before is not None and cursor_phase < completed):
+                    continue
+            
+            remaining = -1 if limit is None else limit - len(tasks)
+            if remaining == 0:
+                break
+            
+            cursor_key = cursor if cursor is not None and int(cursor["completed"]) == completed else None
+            tasks.extend(self._get_task_page(completed, remaining, cursor_key, priority, before is not None))
         
-        cursor.execute(
-            "INSERT INTO tasks (description, priority) VALUES (?, ?)",
-            (description, priority)
+        if before is not None:
+            tasks.reverse()
+        return tasks
+    
+    def _task_filter(self, completed, priority, cursor, operator):
+        conditions = ["completed = ?"]
+        params = [completed]
+        if priority is None:
+            if cursor is not None:
+                conditions.append(f"(priority_rank, created_at, id) {operator} (?, ?, ?)")
+                params.extend((cursor["priority_rank"], cursor["created_at"], cursor["id"]))
+            return " AND ".join(conditions), params
+        
+        rank = PRIORITY_RANKS.get(priority, 2)
+        conditions.append("priority_rank = ?")
+        params.append(rank)
+        if cursor is not None:
+            if cursor["priority_rank"] == rank:
+                # With the rank pinned, comparing the rest keeps SQLite walking
+                # the index in order instead of sorting the whole range
+                conditions.append(f"(created_at, id) {operator} (?, ?)")
+                params.extend((cursor["created_at"], cursor["id"]))
+            elif (cursor["priority_rank"] < rank) == (operator == "<"):
+                # The cursor sits past every task of this priority
+                conditions.append("0")
+        return " AND ".join(conditions), params
+    
+    def _get_task_page(self, completed, limit, cursor, priority=None, backwards=False):
+        # Backwards pages walk the index the other way from the cursor and
+        # come out in ascending order; get_tasks() flips them back
+        where, params = self._task_filter(completed, priority, cursor, ">" if backwards else "<")
+        order = "ASC" if backwards else "DESC"
+        sql = (
+            f"SELECT {TASK_COLUMNS} FROM tasks WHERE {where} "
+            f"ORDER BY priority_rank {order}, created_at {order}, id {order} LIMIT ?"
         )
         
-        conn.commit()
-        conn.close()
+        with self.lock:
+            rows = self.conn.execute(sql, params + [limit]).fetchall()
+        
+        return [self._row_to_task(row) for row in rows]
+    
+    def count_tasks(self, include_completed=True, priority=None, before=None):
+        # Number of tasks in get_tasks() order, or only those ahead of `before`
+        total = 0
+        for completed in ([0, 1] if include_completed else [0]):
+            cursor = None
+            if before is not None:
+                if int(before["completed"]) < completed:
+                    break
+                if int(before["completed"]) == completed:
+                    cursor = before
+            where, params = self._task_filter(completed, priority, cursor, ">")
+            with self.lock:
+                total += self.conn.execute(f"SELECT COUNT(*) FROM tasks WHERE {where}", params).fetchone()[0]
+        return total
     
-    def get_tasks(self):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def search(self, query, limit=20):
+        # Every word is matched as a prefix ("rep" finds "report"), best bm25 rank first
+        terms = [term.replace('"', '""') for term in query.split()]
+        if not terms:
+            return []
+        match = " ".join(f'"{term}"*' for term in terms)
         
-        cursor.execute("SELECT * FROM tasks ORDER BY priority DESC, created_at DESC")
-        tasks = []
+        columns = ", ".join(f"tasks.{column.strip()}" for column in TASK_COLUMNS.split(","))
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT {columns} FROM ("
+                "SELECT rowid, rank FROM tasks_fts WHERE tasks_fts MATCH ? ORDER BY rank LIMIT ?"
+                ") AS hits JOIN tasks ON tasks.id = hits.rowid ORDER BY hits.rank",
+                (match, limit)
+            ).fetchall()
         
-        for row in cursor.fetchall():
-            tasks.append({
-                "id": row[0],
-                "description": row[1],
-                "priority": row[2],
-                "completed": bool(row[3]),
-                "created_at": row[4],
-                "completed_at": row[5]
-            })
-        
-        conn.close()
-        return tasks
+        return [self._row_to_task(row) for row in rows]
     
-    def complete_task(self, task_id):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def _row_to_task(self, row):
+        return Task(row)
+    
+    def import_tasks(self, tasks, chunk_size=5000):
+        # Batched inserts: one executemany and one transaction per chunk keeps
+        # memory flat for arbitrarily large generators
+        imported = 0
+        chunk = []
         
-        cursor.execute(
-            "UPDATE tasks SET completed = TRUE, completed_at = CURRENT_TIMESTAMP WHERE id = ?",
-            (task_id,)
-        )
+        for task in tasks:
+            priority = (task.get("priority") or "Medium").strip().title()
+            chunk.append((
+                task["description"],
+                priority,
+                PRIORITY_RANKS.get(priority, 2),
+                1 if task.get("completed") else 0,
+                task.get("created_at"),
+                task.get("completed_at")
+            ))
+            if len(chunk) >= chunk_size:
+                imported += self._insert_chunk(chunk)
+                chunk = []
         
-        conn.commit()
-        conn.close()
+        if chunk:
+            imported += self._insert_chunk(chunk)
+        
+        return imported
+    
+    def _insert_chunk(self, rows):
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT INTO tasks (description, priority, priority_rank, completed, created_at, completed_at) "
+                "VALUES (?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP), ?)",
+                rows
+            )
+            self.write_count += 1
+        return len(rows)
+    
+    def iter_rows(self, batch_size=1000):
+        # Streams every task in id order without loading the table into memory
+        return self._stream(f"SELECT {TASK_COLUMNS} FROM tasks ORDER BY id", [], batch_size)
+    
+    def iter_tasks(self, include_completed=True, priority=None, batch_size=1000):
+        # get_tasks() order and filters, one batch of rows in memory at a time
+        for completed in ([0, 1] if include_completed else [0]):
+            where, params = self._task_filter(completed, priority, None, "<")
+            yield from self._stream(
+                f"SELECT {TASK_COLUMNS} FROM tasks WHERE {where} "
+                "ORDER BY priority_rank DESC, created_at DESC, id DESC",
+                params, batch_size
+            )
+    
+    def _stream(self, sql, params, batch_size):
+        cursor = self.conn.cursor()
+        with self.lock:
+            cursor.execute(sql, params)
+        
+        while True:
+            with self.lock:
+                rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield self._row_to_task(row)
+        
+        cursor.close()
+    
+    def complete_task(self, task_id):
+        with self.lock, self.conn:
+            self.conn.execute(
+                "UPDATE tasks SET completed = TRUE, completed_at = CURRENT_TIMESTAMP WHERE id = ? AND NOT completed",
+                (task_id,)
+            )
+            self.write_count += 1
     
     def delete_task(self, task_id):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+            self.write_count += 1
+    
+    def add_session(self, kind, started_at, ended_at, duration):
+        # Unix timestamps in, UTC text out, matching CURRENT_TIMESTAMP
+        def utc_text(timestamp):
+            return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        
+        with self.lock, self.conn:
+            self.conn.execute(
+                # Ignored when another dashboard already recorded this phase
+                "INSERT OR IGNORE INTO sessions (kind, started_at, ended_at, duration) VALUES (?, ?, ?, ?)",
+                (kind, utc_text(started_at), utc_text(ended_at), duration)
+            )
+            self.write_count += 1
+    
+    def get_stats(self, days=7, today=None):
+        # Reads only the rollup rows for the window, so the cost doesn't grow
+        # with years of history. Days are local dates, newest last.
+        today = today or date.today()
+        since = (today - timedelta(days=days - 1)).isoformat()
+        
+        with self.lock:
+            completion_rows = self.conn.execute(
+                "SELECT day, priority_rank, completed, completion_seconds FROM daily_completions "
+                "WHERE day >= ? AND day <= ?",
+                (since, today.isoformat())
+            ).fetchall()
+            focus_rows = self.conn.execute(
+                "SELECT day, sessions, focus_seconds FROM daily_focus WHERE day >= ? AND day <= ?",
+                (since, today.isoformat())
+            ).fetchall()
+        
+        by_day = {}
+        for offset in range(days):
+            day = (today - timedelta(days=days - 1 - offset)).isoformat()
+            by_day[day] = {"completed": 0, "focus_minutes": 0}
+        
+        completed = {priority: 0 for priority in PRIORITY_RANKS}
+        priority_names = {rank: priority for priority, rank in PRIORITY_RANKS.items()}
+        total_seconds = 0
+        for day, rank, count, seconds in completion_rows:
+            completed[priority_names.get(rank, "Medium")] += count
+            by_day[day]["completed"] += count
+            total_seconds += seconds
         
-        cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+        sessions = 0
+        focus_seconds = 0
+        for day, day_sessions, seconds in focus_rows:
+            sessions += day_sessions
+            focus_seconds += seconds
+            by_day[day]["focus_minutes"] = seconds // 60
         
-        conn.commit()
-        conn.close()
\ No newline at end of file
+        completed_total = sum(completed.values())
+        return {
+            "since": since,
+            "days": days,
+            "completed": completed,
+            "completed_total": completed_total,
+            "avg_completion_seconds": total_seconds // completed_total if completed_total else None,
+            "focus_sessions": sessions,
+            "focus_minutes": focus_seconds // 60,
+            "by_day": by_day
+        }
@@ -0,0 +1,126 @@
+# diff_live.py
+# rich's Live repaints the whole alternate screen on every refresh. DiffLive
+# remembers the last frame and writes only the changed part of each changed
+# line, which is what costs bandwidth (and flickers) over SSH or mosh.
+from rich.cells import get_character_cell_size
+from rich.control import Control
+from rich.live import Live
+from rich.segment import Segment
+
+def line_cells(line):
+    # One (text, style) pair per terminal cell; the right half of a wide
+    # character is an empty placeholder so columns line up between frames
+    cells = []
+    for text, style, control in line:
+        if control:
+            continue
+        for char in text:
+            width = get_character_cell_size(char)
+            if width == 0:
+                # Combining marks ride along with the character before them
+                if cells and cells[-1][0]:
+                    cells[-1] = (cells[-1][0] + char, cells[-1][1])
+                continue
+            cells.append((char, style))
+            if width == 2:
+                cells.append(("", style))
+    return cells
+
+def changed_span(old, new):
+    # (start, end) cell range that differs between two lines, or None
+    start = 0
+    limit = min(len(old), len(new))
+    while start < limit and old[start] == new[start]:
+        start += 1
+    if start == len(old) == len(new):
+        return None
+
+    end_old, end_new = len(old), len(new)
+    while end_old > start and end_new > start and old[end_old - 1] == new[end_new - 1]:
+        end_old -= 1
+        end_new -= 1
+    # Never start on the right half of a wide character
+    while 0 < start < len(new) and new[start][0] == "":
+        start -= 1
+    return start, end_new
+
+def span_segments(cells):
+    # Consecutive cells with the same style become one segment
+    text = []
+    style = None
+    for char, cell_style in cells:
+        if text and cell_style != style:
+            yield Segment("".join(text), style)
+            text = []
+        style = cell_style
+        text.append(char)
+    if text:
+        yield Segment("".join(text), style)
+
+class FrameDiff:
+    # Renders the live renderable full-screen and yields cursor moves plus
+    # the changed cells, relative to what DiffLive last put on screen
+    def __init__(self, live):
+        self.live = live
+
+    def __rich_console__(self, console, options):
+        live = self.live
+        width, height = options.size
+        lines = console.render_lines(live.renderable, options.update(width=width, height=height), pad=True)
+        lines = Segment.set_shape(lines, width, height)
+
+        previous = live.frame
+        if previous is None or len(previous) != len(lines) or (width, height) != live.frame_size:
+            previous = [[] for _ in lines]
+
+        for y, line in enumerate(lines):
+            if line == previous[y]:
+                continue
+            cells = line_cells(line)
+            span = changed_span(line_cells(previous[y]), cells)
+            if span is None:
+                continue
+            start, end = span
+            yield Control.move_to(start, y)
+            yield from span_segments(cells[start:end])
+
+        live.frame = lines
+        live.frame_size = (width, height)
+
+class DiffLive(Live):
+    # With diff=False this is plain Live, which is also what it falls back
+    # to on anything that isn't an interactive terminal
+    def __init__(self, *args, diff=True, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.diff = diff
+        self.frame = None  # segment lines currently on screen
+        self.frame_size = None
+
+    def invalidate(self):
+        # Forget the screen contents; the next refresh repaints everything
+        self.frame = None
+
+    def diffing(self):
+        return self.diff and self.console.is_interactive and not self.console.is_dumb_terminal
+
+    def refresh(self):
+        if not self.diffing():
+            self.invalidate()
+            super().refresh()
+            return
+
+        with self._lock, self.console:
+            # The frame positions every span itself; cropping the output to
+            # the console width would cut spans from several lines short
+            self.console.print(Control(), crop=False)
+
+    def process_renderables(self, renderables):
+        if not self.diffing():
+            return super().process_renderables(renderables)
+
+        with self._lock:
+            if all(isinstance(renderable, Control) for renderable in renderables):
+                return [*renderables, FrameDiff(self)]
+            # A prompt or stray output: show it, then repaint in full
+            self.invalidate()
+            return [Control.home(), *renderables]
@@ -0,0 +1,112 @@
+# event_loop.py
+import heapq
+import itertools
+import selectors
+import socket
+import time
+
+class EventLoop:
+    def __init__(self, on_error=None):
+        self.selector = selectors.DefaultSelector()
+        self.timers = []
+        self.counter = itertools.count()
+        self.cancelled = set()
+        self.running = False
+        self.on_error = on_error
+        self.wakeup_callbacks = []
+        
+        # Other threads write a byte here to interrupt select()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self.selector.register(self._wake_r, selectors.EVENT_READ, self._drain_wakeups)
+    
+    def add_reader(self, fileobj, callback):
+        self.selector.register(fileobj, selectors.EVENT_READ, callback)
+    
+    def remove_reader(self, fileobj):
+        self.selector.unregister(fileobj)
+    
+    def call_at(self, deadline, callback, interval=None):
+        handle = next(self.counter)
+        heapq.heappush(self.timers, (deadline, handle, interval, callback))
+        return handle
+    
+    def call_later(self, delay, callback):
+        return self.call_at(time.monotonic() + delay, callback)
+    
+    def call_every(self, interval, callback, delay=None):
+        start = time.monotonic() + (interval if delay is None else delay)
+        return self.call_at(start, callback, interval)
+    
+    def cancel(self, handle):
+        self.cancelled.add(handle)
+    
+    def on_wakeup(self, callback):
+        self.wakeup_callbacks.append(callback)
+    
+    def wakeup(self):
+        # Safe to call from any thread
+        try:
+            self._wake_w.send(b"\0")
+        except (BlockingIOError, OSError):
+            pass
+    
+    def _drain_wakeups(self, sock):
+        try:
+            while sock.recv(512):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+        for callback in self.wakeup_callbacks:
+            callback()
+    
+    def stop(self):
+        self.running = False
+    
+    def _dispatch(self, callback, *args):
+        try:
+            callback(*args)
+        except Exception as e:
+            if self.on_error is None:
+                raise
+            self.on_error(e)
+    
+    def _run_due_timers(self):
+        now = time.monotonic()
+        while self.timers and self.timers[0][0] <= now:
+            deadline, handle, interval, callback = heapq.heappop(self.timers)
+            if handle in self.cancelled:
+                self.cancelled.discard(handle)
+                continue
+            if interval is not None:
+                # Schedule from the old deadline so periodic timers don't drift,
+                # but skip missed ticks instead of bursting to catch up
+                next_deadline = deadline + interval
+                if next_deadline <= now:
+                    next_deadline = now + interval
+                heapq.heappush(self.timers, (next_deadline, handle, interval, callback))
+            self._dispatch(callback)
+    
+    def run(self):
+        self.running = True
+        try:
+            while self.running:
+                # Sleep until the next timer is due or a file becomes readable
+                timeout = None
+                if self.timers:
+                    timeout = max(self.timers[0][0] - time.monotonic(), 0)
+                
+                for key, _ in self.selector.select(timeout):
+                    self._dispatch(key.data, key.fileobj)
+                    if not self.running:
+                        return
+                
+                self._run_due_timers()
+        finally:
+            self.running = False
+    
+    def close(self):
+        self.selector.close()
+        self._wake_r.close()
+        self._wake_w.close()
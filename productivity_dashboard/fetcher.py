@@ -0,0 +1,86 @@
+# fetcher.py
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+class BackgroundFetcher:
+    def __init__(self, sources, max_workers=None):
+        self.sources = dict(sources)
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or max(len(self.sources), 1),
+            thread_name_prefix="fetch"
+        )
+        self.lock = threading.Lock()
+        self.results = {}
+        self.digests = {}
+        self.versions = {}
+        self.pending = set()
+        self.updated = set()
+        # Called from the worker thread after each fetch, e.g. to wake an event loop
+        self.on_update = None
+
+    def refresh(self, names=None):
+        # Never blocks: sources already in flight are left alone
+        for name in names or self.sources:
+            with self.lock:
+                if name in self.pending:
+                    continue
+                self.pending.add(name)
+            future = self.executor.submit(self.sources[name])
+            future.add_done_callback(lambda f, name=name: self._on_done(name, f))
+
+    def _on_done(self, name, future):
+        try:
+            result = future.result()
+        except Exception:
+            result = None
+
+        with self.lock:
+            self.pending.discard(name)
+            # Keep showing the last good data when a fetch fails
+            if result is not None:
+                self._store(name, result)
+            elif name not in self.results:
+                # Let a "fetching" placeholder turn into "unavailable"
+                self.updated.add(name)
+
+        if self.on_update is not None:
+            self.on_update()
+
+    def seed(self, name, value):
+        # Prime a source with previously saved data so the first paint isn't empty
+        with self.lock:
+            if value is not None and name not in self.results:
+                self._store(name, value)
+
+    def _store(self, name, result):
+        # Only count a result as an update when its content actually changed
+        payload = json.dumps(result, sort_keys=True, default=str)
+        digest = hashlib.sha1(payload.encode("utf-8")).digest()
+        if self.digests.get(name) == digest:
+            return
+        self.digests[name] = digest
+        self.results[name] = result
+        self.versions[name] = self.versions.get(name, 0) + 1
+        self.updated.add(name)
+
+    def version(self, name):
+        with self.lock:
+            return self.versions.get(name, 0)
+
+    def get(self, name):
+        with self.lock:
+            return self.results.get(name)
+
+    def is_pending(self, name):
+        with self.lock:
+            return name in self.pending
+
+    def pop_updated(self):
+        with self.lock:
+            updated, self.updated = self.updated, set()
+        return updated
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
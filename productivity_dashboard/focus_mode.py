@@ -4,11 +4,20 @@ import os
 import tempfile
 from pathlib import Path
 
+from blocklist import load_index
+
+BLOCK_START = "# BEGIN Productivity Dashboard Focus Mode"
+BLOCK_END = "# END Productivity Dashboard Focus Mode"
+# Older versions appended an unterminated block under this header
+LEGACY_MARKER = "# Productivity Dashboard Focus Mode"
+REDIRECT_IP = "127.0.0.1"
+
 class FocusMode:
-    def __init__(self):
-        self.hosts_path = self.get_hosts_path()
-        self.blocked_sites = []
-        self.is_active = False
+    def __init__(self, sites=None, blocklist_path=None, hosts_path=None, cache_path=None):
+        self.hosts_path = Path(hosts_path) if hosts_path else self.get_hosts_path()
+        self.cache_path = cache_path
+        self.set_rules(sites, blocklist_path)
+        self.is_active = self.has_managed_block()
     
     def get_hosts_path(self):
         if platform.system() == "Windows":
@@ -16,28 +25,123 @@ class FocusMode:
         else:
             return Path("/etc/hosts")
     
+    def has_managed_block(self):
+        try:
+            with open(self.hosts_path, 'r') as f:
+                return any(line.strip() in (BLOCK_START, LEGACY_MARKER) for line in f)
+        except OSError:
+            return False
+    
+    def set_rules(self, sites=None, blocklist_path=None):
+        # Takes effect on the next enable(); an active block is left as it is
+        self.blocked_sites = list(sites or [])
+        self.blocklist_path = os.path.expanduser(blocklist_path) if blocklist_path else None
+        self.index = None
+    
+    def get_index(self):
+        # Compiled once, then reused from the on-disk cache until a source changes
+        if self.index is None:
+            paths = [self.blocklist_path] if self.blocklist_path else []
+            self.index = load_index(self.blocked_sites, paths, self.cache_path)
+        return self.index
+    
+    def is_blocked(self, host):
+        return self.get_index().is_blocked(host)
+    
+    def blocked_domains(self):
+        return self.get_index().host_entries()
+    
+    def read_unmanaged_lines(self):
+        # The hosts file minus our block (and any legacy block), the hostnames
+        # those remaining lines already map, and whether a block was found
+        lines = []
+        hostnames = set()
+        found = False
+        in_block = False
+        in_legacy_block = False
+        
+        with open(self.hosts_path, 'r') as f:
+            for line in f:
+                stripped = line.strip()
+                if stripped in (BLOCK_START, LEGACY_MARKER) and lines and lines[-1] == "\n":
+                    # The blank separator enable() put before the block
+                    lines.pop()
+                if stripped == BLOCK_START:
+                    in_block = found = True
+                    continue
+                if in_block:
+                    if stripped == BLOCK_END:
+                        in_block = False
+                    continue
+                if stripped == LEGACY_MARKER:
+                    in_legacy_block = found = True
+                    continue
+                if in_legacy_block:
+                    if stripped.startswith(REDIRECT_IP) or not stripped:
+                        continue
+                    in_legacy_block = False
+                
+                lines.append(line)
+                entry = stripped.split("#", 1)[0].split()
+                hostnames.update(name.lower() for name in entry[1:])
+        
+        return lines, hostnames, found
+    
+    def write_hosts(self, lines):
+        # Write a sibling temp file, fsync it and rename over the original, so
+        # the hosts file is always either the old or the new version
+        directory = self.hosts_path.parent
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".hosts.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.writelines(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            try:
+                os.chmod(tmp_path, os.stat(self.hosts_path).st_mode & 0o7777)
+            except OSError:
+                pass
+            os.replace(tmp_path, self.hosts_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        
+        if hasattr(os, "O_DIRECTORY"):
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+    
     def enable(self, sites=None):
         if sites:
             self.blocked_sites = sites
+            self.index = None
         
-        if not self.blocked_sites:
+        if not self.blocked_sites and not self.blocklist_path:
             return False
         
         try:
-            # Backup current hosts file
-            with open(self.hosts_path, 'r') as f:
-                original_content = f.read()
+            lines, existing, _ = self.read_unmanaged_lines()
+            # Hostnames the user already maps themselves are left alone
+            managed = sorted(self.blocked_domains() - existing)
             
-            # Add blocked sites to hosts file
-            with open(self.hosts_path, 'a') as f:
-                f.write("\n# Productivity Dashboard Focus Mode\n")
-                for site in self.blocked_sites:
-                    f.write(f"127.0.0.1 {site}\n")
-                    f.write(f"127.0.0.1 www.{site}\n")
+            if lines and not lines[-1].endswith("\n"):
+                lines[-1] += "\n"
+            # Always one separator of our own, so disable() can remove exactly
+            # that line and leave any blank lines the file already ended with
+            lines.append("\n")
+            lines.append(BLOCK_START + "\n")
+            lines.extend(f"{REDIRECT_IP} {domain}\n" for domain in managed)
+            lines.append(BLOCK_END + "\n")
             
+            self.write_hosts(lines)
             self.is_active = True
             return True
-            
+        
         except PermissionError:
             print("Permission denied. Try running as administrator/root.")
             return False
@@ -47,39 +151,16 @@ class FocusMode:
     
     def disable(self):
         try:
-            # Read current hosts file
-            with open(self.hosts_path, 'r') as f:
-                lines = f.readlines()
-            
-            # Remove our entries
-            new_lines = []
-            in_block = False
-            
-            for line in lines:
-                if line.strip() == "# Productivity Dashboard Focus Mode":
-                    in_block = True
-                    continue
-                if in_block and line.startswith("127.0.0.1"):
-                    continue
-                if in_block and not line.startswith("127.0.0.1"):
-                    in_block = False
-                
-                if not in_block:
-                    new_lines.append(line)
-            
-            # Write cleaned hosts file
-            with open(self.hosts_path, 'w') as f:
-                f.writelines(new_lines)
+            lines, _, found = self.read_unmanaged_lines()
+            if found:
+                self.write_hosts(lines)
             
             self.is_active = False
             return True
-            
+        
         except PermissionError:
             print("Permission denied. Try running as administrator/root.")
             return False
         except Exception as e:
             print(f"Error disabling focus mode: {e}")
             return False
-    
-    def is_active(self):
-        return self.is_active
\ No newline at end of file
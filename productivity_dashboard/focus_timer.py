@@ -1,91 +1,177 @@
 # focus_timer.py
+import json
+import os
+import tempfile
 import time
-from datetime import timedelta
+from pathlib import Path
+
+PHASE_DURATIONS = {
+    "focus": "work_duration",
+    "break": "break_duration",
+    "long_break": "long_break_duration"
+}
 
 class FocusTimer:
-    def __init__(self):
+    # Transitions happen in advance(), at time.monotonic() deadlines the
+    # caller schedules via next_deadline(); get_status() only reads state.
+    def __init__(self, state_path=None, on_session=None):
         self.work_duration = 25 * 60  # 25 minutes in seconds
         self.break_duration = 5 * 60  # 5 minutes in seconds
         self.long_break_duration = 15 * 60  # 15 minutes in seconds
         self.sessions_before_long_break = 4
         
-        self.reset()
+        self.state_path = Path(state_path) if state_path else Path.home() / ".productivity_dashboard" / "timer.json"
+        # Called as on_session(kind, started_at, ended_at, duration) when a phase runs out
+        self.on_session = on_session
+        
+        self.clear()
+        self.load()
     
-    def reset(self):
-        self.start_time = None
-        self.paused_time = None
+    def clear(self):
+        self.phase = None
         self.is_running = False
-        self.is_break = False
+        self.deadline = None
+        self.remaining = 0
+        self.phase_started_at = None
         self.sessions_completed = 0
         self.mode = "Ready"
     
+    def reset(self):
+        self.clear()
+        self.save()
+    
+    def duration_of(self, phase):
+        return getattr(self, PHASE_DURATIONS[phase])
+    
+    def begin(self, phase, mode, start=None):
+        start = time.monotonic() if start is None else start
+        self.phase = phase
+        self.mode = mode
+        self.is_running = True
+        self.remaining = self.duration_of(phase)
+        self.deadline = start + self.remaining
+        self.phase_started_at = time.time() - (time.monotonic() - start)
+    
     def start(self):
-        if not self.is_running:
+        if self.is_running:
+            return
+        
+        if self.phase is None:
+            self.begin("focus", "Focus")
+        else:
+            # Resume from paused state
             self.is_running = True
-            self.mode = "Focus" if not self.is_break else "Break"
-            
-            if self.paused_time:
-                # Resume from paused state
-                self.start_time = time.time() - (self.paused_time - self.start_time)
-                self.paused_time = None
-            else:
-                # Start fresh
-                self.start_time = time.time()
+            self.deadline = time.monotonic() + self.remaining
+            self.mode = "Focus" if self.phase == "focus" else "Break"
+        self.save()
     
     def pause(self):
         if self.is_running:
+            self.remaining = max(self.deadline - time.monotonic(), 0)
             self.is_running = False
-            self.paused_time = time.time()
+            self.deadline = None
             self.mode = "Paused"
+            self.save()
     
     def start_break(self):
-        self.is_break = True
-        self.start_time = time.time()
-        self.is_running = True
-        self.mode = "Break"
+        self.begin("break", "Break")
+        self.save()
+    
+    def next_deadline(self):
+        return self.deadline if self.is_running else None
     
-    def get_status(self):
-        if not self.is_running or not self.start_time:
-            return {
-                "mode": self.mode,
-                "time_remaining": "00:00",
-                "sessions_completed": self.sessions_completed
-            }
+    def advance(self, now=None, save=True):
+        # Completes the current phase if its deadline has passed and starts
+        # the next one. Returns True when the state changed.
+        now = time.monotonic() if now is None else now
+        if not self.is_running or now < self.deadline:
+            return False
         
-        elapsed = time.time() - self.start_time
-        duration = self.break_duration if self.is_break else self.work_duration
+        finished, deadline = self.phase, self.deadline
+        if self.on_session is not None:
+            ended_at = time.time() - (now - deadline)
+            duration = self.duration_of(finished)
+            started_at = self.phase_started_at or ended_at - duration
+            self.on_session(finished, started_at, ended_at, duration)
         
-        if elapsed >= duration:
-            # Session completed
-            self.is_running = False
-            
-            if not self.is_break:
-                # Work session completed
-                self.sessions_completed += 1
-                self.is_break = True
-                self.mode = "Break Time!"
-                
-                # Check if it's time for a long break
-                if self.sessions_completed % self.sessions_before_long_break == 0:
-                    duration = self.long_break_duration
-                
-                self.start_time = time.time()
-                self.is_running = True
+        if finished == "focus":
+            self.sessions_completed += 1
+            if self.sessions_completed % self.sessions_before_long_break == 0:
+                next_phase, mode = "long_break", "Long Break!"
             else:
-                # Break completed
-                self.is_break = False
-                self.mode = "Focus Time!"
-                self.start_time = time.time()
-                self.is_running = True
-            
-            # Reset elapsed time after switching mode
-            elapsed = 0
+                next_phase, mode = "break", "Break Time!"
+        else:
+            next_phase, mode = "focus", "Focus Time!"
         
-        time_remaining = duration - elapsed
-        minutes, seconds = divmod(int(time_remaining), 60)
+        # The next phase starts when the last one ended, unless it would be
+        # over already (the dashboard was closed): then it starts now
+        start = deadline
+        if now - deadline >= self.duration_of(next_phase):
+            start = now
+        self.begin(next_phase, mode, start)
+        if save:
+            self.save()
+        return True
+    
+    def catch_up(self, now=None):
+        # Moves past phases that ran out while nothing was driving the timer,
+        # in memory only: the next dashboard to load the state file still
+        # sees them end and records their sessions
+        while self.advance(now, save=False):
+            pass
+    
+    def get_status(self, now=None):
+        if self.is_running:
+            now = time.monotonic() if now is None else now
+            time_remaining = max(self.deadline - now, 0)
+        else:
+            time_remaining = self.remaining
         
+        minutes, seconds = divmod(int(time_remaining), 60)
         return {
             "mode": self.mode,
             "time_remaining": f"{minutes:02d}:{seconds:02d}",
             "sessions_completed": self.sessions_completed
-        }
\ No newline at end of file
+        }
+    
+    def save(self):
+        # Monotonic time doesn't survive a restart, so running phases are
+        # stored as a wall-clock end time
+        state = {
+            "phase": self.phase,
+            "mode": self.mode,
+            "is_running": self.is_running,
+            "remaining": self.remaining,
+            "ends_at": time.time() + (self.deadline - time.monotonic()) if self.is_running else None,
+            "phase_started_at": self.phase_started_at,
+            "sessions_completed": self.sessions_completed
+        }
+        
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.state_path.parent, suffix=".tmp")
+            with os.fdopen(fd, 'w') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.state_path)
+        except OSError:
+            pass
+    
+    def load(self):
+        try:
+            with open(self.state_path, 'r') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False
+        
+        if state.get("phase") not in PHASE_DURATIONS:
+            return False
+        
+        self.phase = state["phase"]
+        self.mode = state.get("mode", "Ready")
+        self.remaining = state.get("remaining", 0)
+        self.phase_started_at = state.get("phase_started_at")
+        self.sessions_completed = state.get("sessions_completed", 0)
+        self.is_running = bool(state.get("is_running")) and state.get("ends_at") is not None
+        if self.is_running:
+            self.deadline = time.monotonic() + (state["ends_at"] - time.time())
+        return True
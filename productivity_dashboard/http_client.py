@@ -0,0 +1,87 @@
+# http_client.py
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+_session = None
+_session_lock = threading.Lock()
+
+def get_session():
+    # One pooled session for every API client, so refreshes reuse TCP+TLS connections
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            _session.mount("http://", adapter)
+            _session.mount("https://", adapter)
+        return _session
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    pass
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold=3, cooldown=60):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self.lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        with self.lock:
+            return self.opened_at is not None and time.monotonic() - self.opened_at < self.cooldown
+
+    def allow(self):
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at < self.cooldown:
+                return False
+            # Half-open: let one trial request through and re-arm the cooldown
+            self.opened_at = time.monotonic()
+            return True
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+def get_json(url, params, breaker, retries=2, backoff=0.5, timeout=(3.05, 10), with_headers=False):
+    if not breaker.allow():
+        raise CircuitOpenError(f"{url} is failing; retrying after cooldown")
+
+    session = get_session()
+    for attempt in range(retries + 1):
+        try:
+            response = session.get(url, params=params, timeout=timeout)
+            if response.status_code in RETRYABLE_STATUS and attempt < retries:
+                time.sleep(random.uniform(0, backoff * 2 ** attempt))
+                continue
+            response.raise_for_status()
+            data = response.json()
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if attempt < retries:
+                # Full jitter keeps several dashboards from retrying in lockstep
+                time.sleep(random.uniform(0, backoff * 2 ** attempt))
+                continue
+            breaker.record_failure()
+            raise
+        except requests.exceptions.RequestException:
+            breaker.record_failure()
+            raise
+
+        breaker.record_success()
+        return (data, response.headers) if with_headers else data
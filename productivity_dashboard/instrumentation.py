@@ -0,0 +1,112 @@
+# instrumentation.py
+import cProfile
+import functools
+import io
+import pstats
+import time
+from collections import deque
+from contextlib import contextmanager
+
+class LatencyHistogram:
+    def __init__(self, window=512):
+        # Rolling window: recent behaviour matters more than a lifetime average
+        self.samples = deque(maxlen=window)
+        self.count = 0
+
+    def record(self, ms):
+        self.samples.append(ms)
+        self.count += 1
+
+    def summary(self):
+        samples = sorted(self.samples)
+        if not samples:
+            return {"count": 0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+        return {
+            "count": self.count,
+            "p50": samples[len(samples) // 2],
+            "p95": samples[min(int(len(samples) * 0.95), len(samples) - 1)],
+            "max": samples[-1]
+        }
+
+class Instrumentation:
+    def __init__(self):
+        self.enabled = False
+        # While profiling, hiding the stats panel must not stop the recording
+        self.profiling = False
+        self.histograms = {}
+        self.targets = []
+
+    def register(self, obj, method_names, prefix):
+        # Methods are only wrapped while enabled, so the off state costs nothing
+        self.targets.append((obj, method_names, prefix))
+        if self.enabled:
+            self._wrap(obj, method_names, prefix)
+
+    def enable(self):
+        if not self.enabled:
+            self.enabled = True
+            for target in self.targets:
+                self._wrap(*target)
+
+    def disable(self):
+        if self.enabled and not self.profiling:
+            self.enabled = False
+            for obj, method_names, _ in self.targets:
+                for name in method_names:
+                    # Dropping the instance attribute uncovers the class method again
+                    obj.__dict__.pop(name, None)
+
+    def _wrap(self, obj, method_names, prefix):
+        for name in method_names:
+            method = getattr(type(obj), name).__get__(obj)
+            histogram = self.histograms.setdefault(f"{prefix}.{name}", LatencyHistogram())
+            setattr(obj, name, self._timed(method, histogram))
+
+    def _timed(self, method, histogram):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                histogram.record((time.perf_counter() - start) * 1000)
+        return wrapper
+
+    def summary(self):
+        return {
+            name: histogram.summary()
+            for name, histogram in sorted(self.histograms.items())
+            if histogram.count
+        }
+
+    def report(self):
+        lines = [f"{'operation':<36}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}"]
+        for name, stats in self.summary().items():
+            lines.append(
+                f"{name:<36}{stats['count']:>8}{stats['p50']:>10.2f}{stats['p95']:>10.2f}{stats['max']:>10.2f}"
+            )
+        return "\n".join(lines)
+
+# Shared by the dashboard, the stats panel and --profile
+stats = Instrumentation()
+
+@contextmanager
+def profile_to(path):
+    stats.enable()
+    stats.profiling = True
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        stats.profiling = False
+        profiler.dump_stats(f"{path}.prof")
+
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats("cumulative").print_stats(40)
+        with open(path, 'w') as f:
+            f.write("Latency histograms\n\n")
+            f.write(stats.report())
+            f.write("\n\ncProfile (top 40 by cumulative time)\n")
+            f.write(output.getvalue())
@@ -0,0 +1,326 @@
+# panels.py
+# Dashboard panels and the registry that finds them. Panels are named by
+# "module:Class" strings and imported only when enabled, so a dashboard
+# with the weather and crypto panels turned off never loads requests.
+#
+# config.json can enable, disable or re-time any panel, or add one:
+#   "panels": {
+#       "weather": {"enabled": false},
+#       "crypto": {"interval": 120},
+#       "todo_sync": {"class": "my_module:TodoSyncPanel"}
+#   }
+# Installed packages can also register panels under the
+# "productivity_dashboard.panels" entry point group; set
+# "panels": {"entry_points": false} to skip looking for them.
+import importlib
+import time
+from datetime import date, datetime
+
+from rich import box
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+from rich.text import Text
+
+from database import PRIORITY_RANKS, format_duration
+from instrumentation import stats
+from task_view import TaskView
+
+console = Console()
+
+ENTRY_POINT_GROUP = "productivity_dashboard.panels"
+
+# Built-in panels, in layout order
+BUILTIN_PANELS = {
+    "header": "panels:HeaderPanel",
+    "tasks": "panels:TasksPanel",
+    "timer": "timer_panel:TimerPanel",
+    "stats": "panels:StatsPanel",
+    "weather": "weather_panel:WeatherPanel",
+    "crypto": "crypto_panel:CryptoPanel",
+    "latency": "panels:LatencyPanel",
+    "footer": "panels:FooterPanel",
+}
+
+# Table cell markup by priority rank and by status, built once instead of
+# comparing priority strings on every row of every refresh
+PRIORITY_STYLES = {3: "red", 2: "yellow", 1: "green"}
+PRIORITY_CELLS = {rank: f"[{PRIORITY_STYLES[rank]}]{name}[/{PRIORITY_STYLES[rank]}]" for name, rank in PRIORITY_RANKS.items()}
+STATUS_CELLS = {True: "[green]✓[/green]", False: "[red]✗[/red]"}
+
+def priority_cell(task):
+    if task.priority in PRIORITY_RANKS:
+        return PRIORITY_CELLS[task.priority_rank]
+    # Free-form priorities from imports keep their text, styled by rank
+    style = PRIORITY_STYLES.get(task.priority_rank, "green")
+    return f"[{style}]{task.priority}[/{style}]"
+
+class DashboardPanel:
+    # A panel draws one layout region, named after the panel.
+    #   interval: seconds between refresh() calls, or None to rebuild
+    #             whenever token() changes (checked every second)
+    #   source:   name of the background fetch the panel reads, if any;
+    #             fetch() runs on the fetcher (or the daemon) for it
+    #   keys:     help text for the footer
+    interval = None
+    source = None
+    keys = None
+
+    def __init__(self, dashboard):
+        self.dashboard = dashboard
+        self.name = None
+
+    def start(self, loop):
+        # The event loop is running; arm any timers of the panel's own
+        pass
+
+    def fetch(self):
+        # Blocking fetch for `source`, run on a worker thread
+        return None
+
+    def seed(self):
+        # Last saved data for `source`, painted before the first fetch
+        return None
+
+    def cache_ttl(self, ttl):
+        # A fetch stores its cache entry a little after the tick that started
+        # it, so on the next tick the entry is still just under `interval`
+        # old. Shave a little off the TTL so an interval equal to it goes
+        # upstream every tick instead of every other one.
+        if self.interval:
+            ttl -= min(self.interval * 0.1, 5)
+        return ttl
+
+    def refresh(self):
+        # Called every `interval` seconds
+        if self.source is not None:
+            self.dashboard.fetcher.refresh([self.source])
+
+    def token(self):
+        # Changes whenever render() would draw something different
+        if self.source is not None:
+            return self.dashboard.fetch_token(self.source)
+        return None
+
+    def render(self):
+        raise NotImplementedError
+
+    def handle_key(self, key):
+        # True if the key was the panel's
+        return False
+
+    def apply_config(self, config):
+        pass
+
+    def close(self):
+        pass
+
+def load_class(spec):
+    module_name, _, attribute = spec.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+def discover_panels(config):
+    # name -> "module:Class": built-ins, then installed plugins, then config
+    specs = dict(BUILTIN_PANELS)
+    if config.get("panels.entry_points", True):
+        from importlib.metadata import entry_points
+        for entry in entry_points(group=ENTRY_POINT_GROUP):
+            specs.setdefault(entry.name, entry.value)
+
+    for name, settings in (config.get("panels", {}) or {}).items():
+        if isinstance(settings, dict) and settings.get("class"):
+            specs[name] = settings["class"]
+    return specs
+
+def create_panels(dashboard, config):
+    # Only enabled panels are imported and constructed
+    panels = {}
+    for name, spec in discover_panels(config).items():
+        if not config.get(f"panels.{name}.enabled", True):
+            continue
+        try:
+            panel = load_class(spec)(dashboard)
+        except (ImportError, AttributeError) as e:
+            console.print(f"Panel '{name}' could not be loaded: {e}", style="red")
+            continue
+
+        panel.name = name
+        panel.interval = config.get(f"panels.{name}.interval", panel.interval)
+        stats.register(panel, ["render"], f"panel.{name}")
+        panels[name] = panel
+    return panels
+
+class HeaderPanel(DashboardPanel):
+    interval = 1
+
+    def token(self):
+        return datetime.now().strftime(self.dashboard.clock_format)
+
+    def render(self):
+        current_time = datetime.now().strftime(self.dashboard.clock_format)
+        header_text = Text(f"Productivity Dashboard | {current_time}", style="bold blue")
+        return Panel(header_text, style="white")
+
+class TasksPanel(DashboardPanel):
+    keys = "(a)dd task, (d)elete task, (c)omplete task, (/) search, (j/k) scroll, (h)ide done, (p)riority"
+
+    def __init__(self, dashboard):
+        super().__init__(dashboard)
+        self.view = TaskView(dashboard.task_manager)
+        self.search_query = None
+
+    def visible_rows(self):
+        # The tasks region is the space between header and footer (half of
+        # it when the timer or stats panel sits below), less the panel
+        # border and the table's header and borders
+        main_height = console.size.height - 6
+        summary = self.dashboard.layout.get("summary")
+        if summary is None or summary.visible:
+            main_height //= 2
+        return max(main_height - 6, 1)
+
+    def token(self):
+        return self.dashboard.change_token(), self.visible_rows(), self.search_query, self.view.state()
+
+    def render(self):
+        task_manager = self.dashboard.task_manager
+        rows = self.visible_rows()
+        if self.search_query:
+            tasks = task_manager.search(self.search_query, limit=rows)
+        else:
+            # Only the rows on screen (plus a small margin) come from the database
+            tasks = self.view.window(rows, self.dashboard.change_token())
+        table = Table(show_header=True, header_style="bold magenta", box=box.ROUNDED)
+        table.add_column("ID", style="dim", width=4)
+        table.add_column("Task", min_width=20)
+        table.add_column("Priority", justify="right")
+        table.add_column("Status", justify="center")
+
+        for task in tasks:
+            table.add_row(str(task.id), task.description, priority_cell(task), STATUS_CELLS[task.completed])
+
+        if self.search_query:
+            title = f"Tasks matching '{self.search_query}'"
+        else:
+            view = self.view
+            first = view.position + 1 if tasks else 0
+            title = f"Tasks {first}-{view.position + len(tasks)} of {view.total}"
+            filters = [name for name in ("pending" if view.hide_completed else None, view.priority) if name]
+            if filters:
+                title += f" ({', '.join(filters)})"
+        return Panel(table, title=title, border_style="green")
+
+    def handle_key(self, key):
+        if key == "a":
+            self.add_task()
+        elif key == "d":
+            self.delete_task()
+        elif key == "c":
+            self.complete_task()
+        elif key == "/":
+            self.search_tasks()
+        elif key in ("j", "\x1b[b", "\x1bob"):
+            self.view.scroll(1)
+        elif key in ("k", "\x1b[a", "\x1boa"):
+            self.view.scroll(-1)
+        elif key == "\x1b[6~":
+            self.view.page(1)
+        elif key == "\x1b[5~":
+            self.view.page(-1)
+        elif key == "h":
+            self.view.toggle_completed()
+        elif key == "p":
+            self.view.cycle_priority()
+        else:
+            return False
+        return True
+
+    def add_task(self):
+        description = console.input("Enter task description: ")
+        priority = console.input("Priority (High/Medium/Low) [Medium]: ") or "Medium"
+        self.dashboard.task_manager.add_task(description, priority)
+
+    def search_tasks(self):
+        query = console.input("Search tasks (empty to clear): ").strip()
+        self.search_query = query or None
+
+    def delete_task(self):
+        task_id = console.input("Enter task ID to delete: ")
+        try:
+            self.dashboard.task_manager.delete_task(int(task_id))
+        except ValueError:
+            console.print("Invalid task ID", style="red")
+
+    def complete_task(self):
+        task_id = console.input("Enter task ID to complete: ")
+        try:
+            self.dashboard.task_manager.complete_task(int(task_id))
+        except ValueError:
+            console.print("Invalid task ID", style="red")
+
+class StatsPanel(DashboardPanel):
+    def token(self):
+        # Rollups only move on writes, plus once at midnight
+        return self.dashboard.change_token(), date.today()
+
+    def render(self):
+        task_manager = self.dashboard.task_manager
+        today = task_manager.get_stats(days=1)
+        week = task_manager.get_stats(days=7)
+
+        table = Table(show_header=True, header_style="bold", box=box.SIMPLE, padding=(0, 1))
+        table.add_column("")
+        table.add_column("Today", justify="right")
+        table.add_column("7 days", justify="right")
+
+        for priority, rank in PRIORITY_RANKS.items():
+            table.add_row(f"{PRIORITY_CELLS[rank]} done", str(today["completed"][priority]), str(week["completed"][priority]))
+        table.add_row(
+            "Time to done",
+            format_duration(today["avg_completion_seconds"]),
+            format_duration(week["avg_completion_seconds"])
+        )
+        table.add_row("Focus minutes", str(today["focus_minutes"]), str(week["focus_minutes"]))
+
+        return Panel(table, title="Stats", border_style="yellow")
+
+class LatencyPanel(DashboardPanel):
+    # Hidden until 'i' is pressed
+    interval = 1
+
+    def visible(self):
+        return self.dashboard.layout[self.name].visible
+
+    def token(self):
+        # Once a second while visible; never while hidden
+        return int(time.monotonic()) if self.visible() else None
+
+    def render(self):
+        table = Table(show_header=True, header_style="bold", box=box.SIMPLE, padding=(0, 1))
+        table.add_column("Operation")
+        table.add_column("p50", justify="right")
+        table.add_column("p95", justify="right")
+        table.add_column("max", justify="right")
+
+        for name, summary in stats.summary().items():
+            table.add_row(name, f"{summary['p50']:.1f}", f"{summary['p95']:.1f}", f"{summary['max']:.1f}")
+
+        return Panel(table, title="Latency (ms)", border_style="blue")
+
+    def handle_key(self, key):
+        if key != "i":
+            return False
+        visible = not self.visible()
+        self.dashboard.layout[self.name].visible = visible
+        self.dashboard.show_regions()
+        if visible:
+            stats.enable()
+        else:
+            stats.disable()
+        return True
+
+class FooterPanel(DashboardPanel):
+    def render(self):
+        commands = [panel.keys for panel in self.dashboard.panels.values() if panel.keys]
+        footer_text = Text(f"Commands: {', '.join(commands + ['(q)uit'])}")
+        return Panel(footer_text, style="white")
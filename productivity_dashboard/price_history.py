@@ -0,0 +1,224 @@
+# price_history.py
+import math
+import os
+import struct
+import tempfile
+import threading
+from array import array
+from collections import deque
+from pathlib import Path
+
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+FILE_MAGIC = b"PDH1"
+
+class RingBuffer:
+    # Fixed-size (timestamp, price) samples with rolling stats updated in O(1)
+    # amortized per append: running sums for mean/variance and monotonic deques
+    # for min/max.
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.times = array('d', [0.0]) * capacity
+        self.values = array('d', [0.0]) * capacity
+        self.start = 0
+        self.size = 0
+        self.seq = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.min_candidates = deque()
+        self.max_candidates = deque()
+        self.candidates_stale = False
+
+    @classmethod
+    def from_arrays(cls, capacity, times, values):
+        # Bulk restore: slice-copy the newest samples; min/max candidates are
+        # rebuilt lazily, so coins that are never displayed cost nothing more
+        ring = cls(capacity)
+        times, values = times[-capacity:], values[-capacity:]
+        ring.size = len(values)
+        ring.times[:ring.size] = times
+        ring.values[:ring.size] = values
+        ring.seq = ring.size
+        ring.total = math.fsum(values)
+        ring.total_sq = math.fsum(value * value for value in values)
+        ring.candidates_stale = True
+        return ring
+
+    def _rebuild_candidates(self):
+        self.min_candidates.clear()
+        self.max_candidates.clear()
+        first_seq = self.seq - self.size
+        for offset, value in enumerate(self.ordered(self.values)):
+            self._push_candidates(first_seq + offset, value)
+        self.candidates_stale = False
+
+    def _push_candidates(self, seq, value):
+        while self.min_candidates and self.min_candidates[-1][1] >= value:
+            self.min_candidates.pop()
+        self.min_candidates.append((seq, value))
+        while self.max_candidates and self.max_candidates[-1][1] <= value:
+            self.max_candidates.pop()
+        self.max_candidates.append((seq, value))
+
+    def append(self, timestamp, value):
+        if self.candidates_stale:
+            self._rebuild_candidates()
+        if self.size == self.capacity:
+            self._evict_oldest()
+
+        end = (self.start + self.size) % self.capacity
+        self.times[end] = timestamp
+        self.values[end] = value
+        self.size += 1
+
+        self.total += value
+        self.total_sq += value * value
+        self._push_candidates(self.seq, value)
+        self.seq += 1
+
+    def _evict_oldest(self):
+        value = self.values[self.start]
+        oldest_seq = self.seq - self.size
+        self.start = (self.start + 1) % self.capacity
+        self.size -= 1
+
+        self.total -= value
+        self.total_sq -= value * value
+        if self.min_candidates and self.min_candidates[0][0] == oldest_seq:
+            self.min_candidates.popleft()
+        if self.max_candidates and self.max_candidates[0][0] == oldest_seq:
+            self.max_candidates.popleft()
+
+    def __len__(self):
+        return self.size
+
+    def ordered(self, column):
+        # Oldest first, as a contiguous array
+        end = self.start + self.size
+        if end <= self.capacity:
+            return column[self.start:end]
+        return column[self.start:] + column[:end - self.capacity]
+
+    @property
+    def minimum(self):
+        if self.candidates_stale:
+            self._rebuild_candidates()
+        return self.min_candidates[0][1] if self.size else math.nan
+
+    @property
+    def maximum(self):
+        if self.candidates_stale:
+            self._rebuild_candidates()
+        return self.max_candidates[0][1] if self.size else math.nan
+
+    @property
+    def mean(self):
+        return self.total / self.size if self.size else math.nan
+
+    @property
+    def stdev(self):
+        if self.size < 2:
+            return 0.0
+        variance = (self.total_sq - self.total * self.total / self.size) / (self.size - 1)
+        return math.sqrt(max(variance, 0.0))
+
+    @property
+    def volatility(self):
+        # Standard deviation as a percentage of the mean price
+        mean = self.mean
+        return self.stdev / mean * 100 if self.size and mean else 0.0
+
+    def sparkline(self, width=16):
+        values = self.ordered(self.values)[-width:]
+        if not values:
+            return ""
+        low, high = min(values), max(values)
+        if high == low:
+            return SPARK_CHARS[len(SPARK_CHARS) // 2] * len(values)
+        scale = (len(SPARK_CHARS) - 1) / (high - low)
+        return "".join(SPARK_CHARS[int((value - low) * scale)] for value in values)
+
+class PriceHistory:
+    def __init__(self, capacity=1440, path=None):
+        self.capacity = capacity
+        self.path = Path(path) if path else Path.home() / ".productivity_dashboard" / "price_history.bin"
+        self.buffers = {}
+        self.lock = threading.Lock()
+        self.dirty = False
+
+    def buffer(self, coin):
+        if coin not in self.buffers:
+            self.buffers[coin] = RingBuffer(self.capacity)
+        return self.buffers[coin]
+
+    def record(self, timestamp, prices):
+        with self.lock:
+            for coin, price in prices:
+                if price == price:  # skip NaN
+                    self.buffer(coin).append(timestamp, price)
+            self.dirty = True
+
+    def get(self, coin):
+        with self.lock:
+            return self.buffers.get(coin)
+
+    def save(self):
+        # Layout: magic, coin count, then per coin its id and samples oldest-first
+        # as two raw float64 arrays. Written to a temp file and renamed.
+        with self.lock:
+            chunks = [FILE_MAGIC, struct.pack("<I", len(self.buffers))]
+            for coin, ring in self.buffers.items():
+                name = coin.encode("utf-8")
+                chunks.append(struct.pack("<HI", len(name), len(ring)))
+                chunks.append(name)
+                chunks.append(ring.ordered(ring.times).tobytes())
+                chunks.append(ring.ordered(ring.values).tobytes())
+            self.dirty = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(b"".join(chunks))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def load(self):
+        # One bulk read; arrays are rebuilt straight from the bytes
+        try:
+            with open(self.path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return False
+
+        if data[:4] != FILE_MAGIC:
+            return False
+
+        try:
+            (count,) = struct.unpack_from("<I", data, 4)
+            offset = 8
+            buffers = {}
+            for _ in range(count):
+                name_length, size = struct.unpack_from("<HI", data, offset)
+                offset += 6
+                coin = data[offset:offset + name_length].decode("utf-8")
+                offset += name_length
+
+                times = array('d')
+                times.frombytes(data[offset:offset + size * 8])
+                offset += size * 8
+                values = array('d')
+                values.frombytes(data[offset:offset + size * 8])
+                offset += size * 8
+
+                # Only the newest `capacity` samples survive a smaller configured size
+                buffers[coin] = RingBuffer.from_arrays(self.capacity, times, values)
+        except (struct.error, UnicodeDecodeError, ValueError):
+            return False
+
+        with self.lock:
+            self.buffers = buffers
+        return True
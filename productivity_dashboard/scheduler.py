@@ -0,0 +1,98 @@
+# scheduler.py
+import random
+import re
+import time
+from collections import deque
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+
+def cache_lifetime(headers):
+    # Seconds the server says its response stays fresh, or None if it doesn't say
+    if not headers:
+        return None
+
+    match = re.search(r"max-age=(\d+)", headers.get("Cache-Control", ""))
+    if match:
+        return int(match.group(1))
+
+    expires = headers.get("Expires")
+    if expires:
+        try:
+            expires_at = parsedate_to_datetime(expires)
+            date = headers.get("Date")
+            now = parsedate_to_datetime(date) if date else None
+            if now is None:
+                return max(expires_at.timestamp() - time.time(), 0)
+            return max((expires_at - now).total_seconds(), 0)
+        except (TypeError, ValueError):
+            return None
+    return None
+
+class RefreshScheduler:
+    # Decides which keys (e.g. cities) may be fetched now. Calls are capped by a
+    # sliding one-hour window, and each key waits at least min_interval, or as
+    # long as the server's cache headers say, or its fair share of the budget.
+    # With `shared` (a callable returning ResponseCache.shared_state(...)) the
+    # call log and due times live on disk, so every process using the same
+    # API key draws on one budget. Times are wall-clock for the same reason.
+    def __init__(self, calls_per_hour, min_interval=600, window=3600, shared=None):
+        self.calls_per_hour = calls_per_hour
+        self.min_interval = min_interval
+        self.window = window
+        self.shared = shared
+        self.calls = deque()
+        self.next_due = {}
+
+    @contextmanager
+    def synced(self):
+        # Loads the shared state, holds its lock while the caller updates it,
+        # then writes it back
+        if self.shared is None:
+            yield
+            return
+
+        with self.shared() as state:
+            self.calls = deque(state.get("calls", []))
+            self.next_due = dict(state.get("next_due", {}))
+            yield
+            state["calls"] = list(self.calls)
+            state["next_due"] = self.next_due
+
+    def interval_for(self, key_count):
+        return max(self.min_interval, key_count * self.window / self.calls_per_hour)
+
+    def remaining(self, now=None):
+        now = time.time() if now is None else now
+        while self.calls and now - self.calls[0] >= self.window:
+            self.calls.popleft()
+        return self.calls_per_hour - len(self.calls)
+
+    def due(self, keys, missing=()):
+        # Reserves budget for the returned keys: those whose time has come,
+        # plus any in `missing` (nothing to show for them yet), most overdue
+        # first. The budget itself is never exceeded.
+        with self.synced():
+            now = time.time()
+            ready = sorted(
+                (key for key in keys if key in missing or self.next_due.get(key, 0) <= now),
+                key=lambda key: 0 if key in missing else self.next_due.get(key, 0)
+            )
+            ready = ready[:max(self.remaining(now), 0)]
+            self.calls.extend([now] * len(ready))
+            return ready
+
+    def fetched(self, key, key_count, headers=None):
+        interval = self.interval_for(key_count)
+        server_lifetime = cache_lifetime(headers)
+        if server_lifetime is not None:
+            interval = max(interval, server_lifetime)
+        with self.synced():
+            # A little jitter spreads keys that were fetched together across the window
+            self.next_due[key] = time.time() + interval * random.uniform(1.0, 1.1)
+
+    def failed(self, key, retry_after=60):
+        with self.synced():
+            self.next_due[key] = time.time() + retry_after
+
+    def next_deadline(self):
+        return min(self.next_due.values(), default=None)
@@ -0,0 +1,51 @@
+# task_io.py
+import csv
+import json
+
+FIELDS = ["description", "priority", "completed", "created_at", "completed_at"]
+
+def detect_format(path, fmt=None):
+    if fmt:
+        return fmt
+    return "jsonl" if str(path).endswith((".jsonl", ".ndjson", ".json")) else "csv"
+
+def parse_bool(value):
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "y", "x", "done")
+    return bool(value)
+
+def read_tasks(f, fmt):
+    if fmt == "jsonl":
+        rows = (json.loads(line) for line in f if line.strip())
+    else:
+        rows = csv.DictReader(f)
+    
+    for row in rows:
+        description = (row.get("description") or "").strip()
+        if not description:
+            continue
+        
+        yield {
+            "description": description,
+            "priority": (row.get("priority") or "Medium").strip(),
+            "completed": parse_bool(row.get("completed", False)),
+            "created_at": row.get("created_at") or None,
+            "completed_at": row.get("completed_at") or None
+        }
+
+def write_tasks(f, tasks, fmt):
+    count = 0
+    
+    if fmt == "jsonl":
+        for task in tasks:
+            f.write(json.dumps({field: task[field] for field in FIELDS}))
+            f.write("\n")
+            count += 1
+    else:
+        writer = csv.DictWriter(f, fieldnames=FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        for task in tasks:
+            writer.writerow({field: task[field] for field in FIELDS})
+            count += 1
+    
+    return count
@@ -0,0 +1,143 @@
+# task_view.py
+PRIORITY_FILTERS = [None, "High", "Medium", "Low"]
+
+class TaskView:
+    # A scrollable window over get_tasks() order. Only the visible rows plus
+    # a prefetch margin are ever loaded, via keyset pages from the rows at
+    # the buffer's edges, so the cost follows the terminal height rather
+    # than the number of tasks.
+    def __init__(self, task_manager, margin=20):
+        self.task_manager = task_manager
+        self.margin = margin
+        self.hide_completed = False
+        self.priority = None
+        self.position = 0  # index of the first visible row
+        self.rows = 1
+        self.total = 0
+        # Loaded rows: buffer[0] is row number buffer_start
+        self.buffer = []
+        self.buffer_start = 0
+        self.at_end = False
+        self.start_cursor = None
+        self.token = None
+
+    def query(self, limit, after=None, before=None):
+        return self.task_manager.get_tasks(
+            limit=limit, after=after, before=before,
+            include_completed=not self.hide_completed, priority=self.priority
+        )
+
+    def reload(self):
+        # Data changed: keep the same task at the top of the viewport and
+        # recount where it now sits
+        top = None
+        if self.position > 0 and self.buffer:
+            offset = min(max(self.position - self.buffer_start, 0), len(self.buffer) - 1)
+            top = self.buffer[offset]
+
+        self.total = self.task_manager.count_tasks(not self.hide_completed, self.priority)
+        self.buffer = []
+        self.at_end = False
+        if top is None:
+            self.position = self.buffer_start = 0
+            self.start_cursor = None
+        else:
+            self.position = self.buffer_start = self.task_manager.count_tasks(
+                not self.hide_completed, self.priority, before=top
+            )
+            # A cursor just ahead of `top` (ids sort descending), so the first
+            # page starts with it even if it was deleted meanwhile
+            self.start_cursor = dict(top.to_dict(), id=top.id + 1)
+
+    def end_cursor(self):
+        # Sorts after every task, so paging backwards from it reads the tail
+        return {"completed": not self.hide_completed, "priority_rank": -1, "created_at": "", "id": 0}
+
+    def rebase(self, end):
+        # A long jump away from the loaded rows: start again from whichever
+        # of the first or last task is closer, instead of walking every row
+        # in between
+        if self.position >= self.buffer_start + len(self.buffer):
+            gap = self.position - self.buffer_start - len(self.buffer)
+        else:
+            gap = max(self.buffer_start - end, 0)
+        from_end = self.total - end
+        if gap <= self.margin * 4 or gap <= min(self.position, from_end):
+            return
+
+        if from_end < self.position:
+            self.buffer = self.query(from_end + self.rows + self.margin, before=self.end_cursor())
+            self.buffer_start = self.total - len(self.buffer)
+            self.at_end = True
+        else:
+            self.buffer = []
+            self.buffer_start = 0
+            self.start_cursor = None
+            self.at_end = False
+
+    def extend_down(self, count):
+        after = self.buffer[-1] if self.buffer else self.start_cursor
+        rows = self.query(count, after=after)
+        self.buffer.extend(rows)
+        self.at_end = len(rows) < count
+
+    def extend_up(self, count):
+        rows = self.query(count, before=self.buffer[0])
+        self.buffer[:0] = rows
+        self.buffer_start -= len(rows)
+        if len(rows) < count:
+            # Reached the first task; row numbers may have drifted
+            self.position -= self.buffer_start
+            self.buffer_start = 0
+
+    def window(self, rows, token=None):
+        # The visible tasks; `token` must change whenever the data may have changed
+        self.rows = rows
+        if self.token is None or token != self.token:
+            self.token = token
+            self.reload()
+
+        self.position = max(min(self.position, self.total - rows), 0)
+        end = self.position + rows
+        if self.buffer:
+            self.rebase(end)
+        if self.buffer_start + len(self.buffer) < end + self.margin // 2 and not self.at_end:
+            self.extend_down(end - self.buffer_start - len(self.buffer) + self.margin)
+        if self.buffer and self.position < self.buffer_start:
+            self.extend_up(self.buffer_start - self.position + self.margin)
+
+        # Drop rows far outside the viewport so long scrolls stay bounded
+        low = max(self.position - self.margin * 2, self.buffer_start)
+        high = end + self.margin * 2
+        if self.buffer_start + len(self.buffer) > high:
+            del self.buffer[high - self.buffer_start:]
+            self.at_end = False
+        if low > self.buffer_start:
+            del self.buffer[:low - self.buffer_start]
+            self.buffer_start = low
+
+        offset = self.position - self.buffer_start
+        return self.buffer[offset:offset + rows]
+
+    def scroll(self, delta):
+        self.position = max(min(self.position + delta, self.total - self.rows), 0)
+
+    def page(self, direction):
+        self.scroll(direction * max(self.rows - 1, 1))
+
+    def reset(self):
+        self.position = 0
+        self.token = None
+
+    def toggle_completed(self):
+        self.hide_completed = not self.hide_completed
+        self.reset()
+
+    def cycle_priority(self):
+        index = PRIORITY_FILTERS.index(self.priority)
+        self.priority = PRIORITY_FILTERS[(index + 1) % len(PRIORITY_FILTERS)]
+        self.reset()
+
+    def state(self):
+        # Everything that changes what window() shows, for panel tokens
+        return self.position, self.hide_completed, self.priority
@@ -0,0 +1,92 @@
+# terminal_input.py
+import os
+import sys
+from contextlib import contextmanager
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows
+    termios = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+def supports_cbreak(stream=None):
+    stream = stream or sys.stdin
+    return termios is not None and stream.isatty()
+
+@contextmanager
+def cbreak(stream=None):
+    # Deliver keystrokes one at a time, without waiting for Enter
+    stream = stream or sys.stdin
+    if not supports_cbreak(stream):
+        yield
+        return
+    
+    fd = stream.fileno()
+    original = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, original)
+
+@contextmanager
+def cooked(stream=None):
+    # Temporarily restore line editing and echo, e.g. around console.input()
+    stream = stream or sys.stdin
+    if not supports_cbreak(stream):
+        yield
+        return
+    
+    fd = stream.fileno()
+    current = termios.tcgetattr(fd)
+    restored = list(current)
+    restored[3] = restored[3] | termios.ICANON | termios.ECHO
+    try:
+        termios.tcsetattr(fd, termios.TCSANOW, restored)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSANOW, current)
+
+def split_keys(data):
+    # Escape sequences (arrows, PgUp/PgDn) are returned whole, everything else per character
+    keys = []
+    i = 0
+    while i < len(data):
+        if data[i] == "\x1b" and i + 1 < len(data) and data[i + 1] in "[O":
+            end = i + 2
+            while end < len(data) and not (data[end].isalpha() or data[end] == "~"):
+                end += 1
+            keys.append(data[i:end + 1])
+            i = end + 1
+        else:
+            keys.append(data[i])
+            i += 1
+    return keys
+
+def read_keys(stream=None):
+    stream = stream or sys.stdin
+    data = os.read(stream.fileno(), 64)
+    if not data:
+        return None  # EOF
+    return split_keys(data.decode("utf-8", errors="ignore"))
+
+def read_line(stream=None):
+    # Without a terminal there is no cbreak mode: each line is one command
+    stream = stream or sys.stdin
+    line = stream.readline()
+    if not line:
+        return None  # EOF
+    line = line.strip()
+    return [line] if line else []
+
+def poll_keys():
+    # Windows console fallback: msvcrt has no selectable handle
+    keys = []
+    while msvcrt is not None and msvcrt.kbhit():
+        keys.append(msvcrt.getwch())
+    return keys
@@ -0,0 +1,101 @@
+# timer_panel.py
+from rich.panel import Panel
+from rich.text import Text
+
+from focus_mode import FocusMode
+from focus_timer import FocusTimer
+from panels import DashboardPanel, console
+
+class TimerPanel(DashboardPanel):
+    interval = 1
+    keys = "(t)imer control, (f)ocus mode"
+
+    def __init__(self, dashboard):
+        super().__init__(dashboard)
+        config = dashboard.config
+        self.focus_timer = FocusTimer(on_session=dashboard.task_manager.add_session)
+        self.focus_mode = FocusMode(
+            sites=config.get("focus_mode.blocked_sites", []),
+            blocklist_path=config.get("focus_mode.blocklist_file")
+        )
+        self.loop = None
+        self.timer_handle = None
+        self.status = None
+
+    def start(self, loop):
+        self.loop = loop
+        # Catch up on a phase that ended while the dashboard was closed
+        self.focus_timer.advance()
+        self.schedule_timer()
+
+    def schedule_timer(self):
+        # One loop timer at the focus timer's next deadline, re-armed after every change
+        if self.loop is None:
+            return
+        if self.timer_handle is not None:
+            self.loop.cancel(self.timer_handle)
+            self.timer_handle = None
+        deadline = self.focus_timer.next_deadline()
+        if deadline is not None:
+            self.timer_handle = self.loop.call_at(deadline, self.on_timer_deadline)
+
+    def on_timer_deadline(self):
+        self.timer_handle = None
+        self.focus_timer.advance()
+        self.schedule_timer()
+        self.dashboard.on_panel_timer(self)
+
+    def token(self):
+        # render() draws the same status the token was taken from
+        self.status = self.focus_timer.get_status()
+        return tuple(self.status.values()), self.focus_mode.is_active
+
+    def render(self):
+        timer_status = self.status or self.focus_timer.get_status()
+
+        timer_text = Text()
+        timer_text.append(f"Mode: {timer_status['mode']}\n", style="bold")
+        timer_text.append(f"Time: {timer_status['time_remaining']}\n")
+        timer_text.append(f"Session: {timer_status['sessions_completed']}/4\n")
+
+        focus_status = "Active" if self.focus_mode.is_active else "Inactive"
+        focus_style = "green" if self.focus_mode.is_active else "red"
+        timer_text.append(f"Focus Mode: [{focus_style}]{focus_status}[/{focus_style}]")
+
+        return Panel(timer_text, title="Focus Timer", border_style="magenta")
+
+    def handle_key(self, key):
+        if key == "t":
+            self.control_timer()
+        elif key == "f":
+            self.toggle_focus_mode()
+        else:
+            return False
+        return True
+
+    def control_timer(self):
+        console.print("Timer controls: (s)tart, (p)ause, (r)eset, (b)reak")
+        action = console.input("Action: ").lower()
+
+        if action == "s":
+            self.focus_timer.start()
+        elif action == "p":
+            self.focus_timer.pause()
+        elif action == "r":
+            self.focus_timer.reset()
+        elif action == "b":
+            self.focus_timer.start_break()
+        self.schedule_timer()
+
+    def toggle_focus_mode(self):
+        if self.focus_mode.is_active:
+            self.focus_mode.disable()
+            console.print("Focus mode disabled", style="red")
+        else:
+            self.focus_mode.enable()
+            console.print("Focus mode enabled", style="green")
+
+    def apply_config(self, config):
+        self.focus_mode.set_rules(
+            config.get("focus_mode.blocked_sites", []), config.get("focus_mode.blocklist_file")
+        )
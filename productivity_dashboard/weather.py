@@ -1,44 +1,108 @@
 # weather.py
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 import requests
-from rich.console import Console
+
+from cache import ResponseCache
+from http_client import CircuitBreaker, CircuitOpenError, get_json
+from scheduler import RefreshScheduler
 
 class WeatherAPI:
-    def __init__(self, config):
+    def __init__(self, config, cache=None):
         self.config = config
+        # Holds the request budget shared by every process using the API key
+        self.cache = cache if cache is not None else ResponseCache()
         self.base_url = "http://api.openweathermap.org/data/2.5/weather"
-        self.api_key = self.config.get("weather.api_key")
-        self.city = self.config.get("weather.city")
-        self.units = self.config.get("weather.units", "metric")
-        self.console = Console()
+        self._console = None
+        self.breaker = CircuitBreaker()
+        self.scheduler = RefreshScheduler(calls_per_hour=50)
+        # Last good reading per city; cities that aren't due are served from here
+        self.results = {}
+        self.units = None
+        self.apply_config(config)
+        config.subscribe(self.apply_config)
     
-    def get_weather(self):
-        if not self.api_key:
-            self.console.print("Weather API key not configured. Run 'python dashboard.py --setup'", style="red")
-            return None
+    def apply_config(self, config):
+        # Runs again on every config reload; breaker and scheduler keep their state
+        self.api_key = config.get("weather.api_key")
+        if self.api_key:
+            self.scheduler.shared = partial(self.cache.shared_state, f"weather-budget:{self.api_key}")
+        self.cities = config.get("weather.cities") or [config.get("weather.city")]
+        self.city = self.cities[0]
+        units = config.get("weather.units", "metric")
+        if units != self.units:
+            self.results = {}
+        self.units = units
+        self.retries = config.get("http.retries", 2)
+        self.breaker.failure_threshold = config.get("http.breaker_threshold", 3)
+        self.breaker.cooldown = config.get("http.breaker_cooldown", 60)
+        # OpenWeatherMap recalculates current weather about every 10 minutes, so
+        # polling a city more often than that can't return anything new
+        self.scheduler.calls_per_hour = config.get("weather.calls_per_hour", 50)
+        self.scheduler.min_interval = config.get("weather.min_interval", 600)
+        self.max_workers = config.get("weather.max_workers", 4)
+    
+    @property
+    def console(self):
+        # rich is only needed once there is an error to report
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console(stderr=True)
+        return self._console
+    
+    @property
+    def cache_key(self):
+        return f"weather:{self.units}:{','.join(self.cities)}"
+    
+    def _fetch_city(self, city):
+        params = {
+            "q": city,
+            "appid": self.api_key,
+            "units": self.units
+        }
         
         try:
-            params = {
-                "q": self.city,
-                "appid": self.api_key,
-                "units": self.units
-            }
-            
-            response = requests.get(self.base_url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            return {
-                "city": self.city,
+            data, headers = get_json(self.base_url, params, self.breaker, retries=self.retries, with_headers=True)
+            reading = {
+                "city": city,
                 "temperature": data["main"]["temp"],
                 "description": data["weather"][0]["description"].title(),
                 "humidity": data["main"]["humidity"],
                 "wind_speed": data["wind"]["speed"] * 3.6,  # Convert m/s to km/h
             }
-            
+            return city, reading, headers, None
+        except CircuitOpenError as e:
+            return city, None, None, e
         except requests.exceptions.RequestException as e:
-            self.console.print(f"Weather API error: {e}", style="red")
+            return city, None, None, f"Weather API error for {city}: {e}"
+        except (KeyError, IndexError, TypeError) as e:
+            return city, None, None, f"Weather data parsing error for {city}: {e}"
+    
+    def get_weather(self):
+        # Returns a reading per configured city, fetching only the cities the
+        # scheduler says are due and within the hourly request budget
+        if not self.api_key:
+            self.console.print("Weather API key not configured. Run 'python dashboard.py --setup'", style="red")
             return None
-        except (KeyError, IndexError) as e:
-            self.console.print(f"Weather data parsing error: {e}", style="red")
-            return None
\ No newline at end of file
+        
+        due = self.scheduler.due(self.cities, [city for city in self.cities if city not in self.results])
+        if len(due) == 1:
+            responses = [self._fetch_city(due[0])]
+        elif due:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(due))) as pool:
+                responses = list(pool.map(self._fetch_city, due))
+        else:
+            responses = []
+        
+        for city, reading, headers, error in responses:
+            if reading is not None:
+                self.results[city] = reading
+                self.scheduler.fetched(city, len(self.cities), headers)
+            else:
+                self.scheduler.failed(city)
+                if not isinstance(error, CircuitOpenError):
+                    self.console.print(error, style="red")
+        
+        readings = [self.results[city] for city in self.cities if city in self.results]
+        return readings or None
@@ -0,0 +1,50 @@
+# weather_panel.py
+from rich.panel import Panel
+from rich.text import Text
+
+from instrumentation import stats
+from panels import DashboardPanel
+from weather import WeatherAPI
+
+class WeatherPanel(DashboardPanel):
+    interval = 600
+    source = "weather"
+
+    def __init__(self, dashboard):
+        super().__init__(dashboard)
+        self.api = WeatherAPI(dashboard.config, dashboard.cache)
+        stats.register(self.api, ["get_weather"], "http")
+
+    def fetch(self):
+        config = self.dashboard.config
+        return self.dashboard.cache.fetch(self.api.cache_key, self.cache_ttl(config.get("cache.ttl.weather", 600)), self.api.get_weather)
+
+    def seed(self):
+        return self.dashboard.cache.load(self.api.cache_key)[0]
+
+    def render(self):
+        fetcher = self.dashboard.fetcher
+        weather_data = fetcher.get("weather")
+        if not weather_data:
+            if fetcher.is_pending("weather"):
+                return Panel("Fetching weather...", title="Weather", border_style="yellow")
+            return Panel("Weather data unavailable", title="Weather", border_style="red")
+
+        weather_text = Text()
+        if len(weather_data) == 1:
+            reading = weather_data[0]
+            weather_text.append(f"Location: {reading['city']}\n", style="bold")
+            weather_text.append(f"Temperature: {reading['temperature']}°C\n")
+            weather_text.append(f"Condition: {reading['description']}\n")
+            weather_text.append(f"Humidity: {reading['humidity']}%\n")
+            weather_text.append(f"Wind: {reading['wind_speed']:.1f} km/h")
+        else:
+            # One line per location
+            for reading in weather_data:
+                weather_text.append(f"{reading['city']}: ", style="bold")
+                weather_text.append(
+                    f"{reading['temperature']:.0f}°C {reading['description']}, "
+                    f"{reading['humidity']}%, {reading['wind_speed']:.0f} km/h\n"
+                )
+
+        return Panel(weather_text, title="Weather", border_style="yellow")
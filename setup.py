@@ -4,14 +4,14 @@ from setuptools import setup, find_packages
 setup(
     name="productivity-dashboard",
     version="0.1.0",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     install_requires=[
         "rich>=13.0.0",
         "requests>=2.28.0",
     ],
     entry_points={
         "console_scripts": [
-            "productivity-dashboard=productivity_dashboard.dashboard:main",
+            "productivity-dashboard=productivity_dashboard.cli:main",
         ],
     },
     author="Your Name",
@@ -0,0 +1,90 @@
+# test_blocklist.py
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "productivity_dashboard"))
+
+import blocklist
+from blocklist import BlocklistIndex, iter_rules, load_index
+
+def make_index(*rules):
+    index = BlocklistIndex()
+    index.update(rules)
+    return index
+
+def test_exact_rule_blocks_domain_and_www():
+    index = make_index("reddit.com")
+    assert index.is_blocked("reddit.com")
+    assert index.is_blocked("WWW.Reddit.com.")
+    assert not index.is_blocked("old.reddit.com")
+    assert not index.is_blocked("notreddit.com")
+
+@pytest.mark.parametrize("rule", ["*.reddit.com", ".reddit.com"])
+def test_wildcard_rule_blocks_apex_and_subdomains(rule):
+    index = make_index(rule)
+    assert index.is_blocked("reddit.com")
+    assert index.is_blocked("old.reddit.com")
+    assert index.is_blocked("a.b.reddit.com")
+    assert not index.is_blocked("notreddit.com")
+
+@pytest.mark.parametrize("exception", ["!old.reddit.com", "@@old.reddit.com"])
+def test_exceptions_allow_a_subdomain(exception):
+    index = make_index("*.reddit.com", exception)
+    assert index.is_blocked("new.reddit.com")
+    assert not index.is_blocked("old.reddit.com")
+
+def test_exact_beats_wildcard():
+    index = make_index("!*.example.com", "ads.example.com")
+    assert index.is_blocked("ads.example.com")
+    assert not index.is_blocked("www.example.com")
+
+    index = make_index("*.example.com", "!login.example.com")
+    assert not index.is_blocked("login.example.com")
+    assert index.is_blocked("mail.example.com")
+
+def test_longest_wildcard_wins():
+    index = make_index("*.example.com", "!*.docs.example.com")
+    assert not index.is_blocked("api.docs.example.com")
+    assert index.is_blocked("api.example.com")
+
+def test_host_entries_expand_and_filter():
+    index = make_index("reddit.com", "*.twitter.com", "!www.twitter.com", "www.youtube.com")
+    assert index.host_entries() == {"reddit.com", "www.reddit.com", "twitter.com", "www.youtube.com"}
+
+def test_iter_rules_reads_plain_and_hosts_format(tmp_path):
+    path = tmp_path / "rules.txt"
+    path.write_text("# comment\nReddit.com\n0.0.0.0 ads.example.com tracker.example.com\n127.0.0.1 localhost\n\n*.x.com  # inline\n")
+    assert list(iter_rules(path)) == ["reddit.com", "ads.example.com", "tracker.example.com", "*.x.com"]
+
+def test_load_index_reuses_cache_until_sources_change(tmp_path, monkeypatch):
+    rules = tmp_path / "rules.txt"
+    rules.write_text("reddit.com\n")
+    cache_path = tmp_path / "blocklist.cache"
+
+    index = load_index(["news.com"], [rules], cache_path)
+    assert index.is_blocked("reddit.com") and index.is_blocked("news.com")
+    assert cache_path.exists()
+
+    # Same sources: served from the cache without reading the rules file
+    def no_read(path):
+        raise AssertionError("rules file was read")
+    monkeypatch.setattr(blocklist, "iter_rules", no_read)
+    assert load_index(["news.com"], [rules], cache_path).is_blocked("reddit.com")
+    monkeypatch.undo()
+
+    # Editing the file changes its signature and forces a recompile
+    rules.write_text("twitter.com\n!www.twitter.com\n")
+    index = load_index(["news.com"], [rules], cache_path)
+    assert not index.is_blocked("reddit.com")
+    assert index.is_blocked("twitter.com")
+    assert not index.is_blocked("www.twitter.com")
+
+    # So does changing the inline sites
+    assert not load_index([], [rules], cache_path).is_blocked("news.com")
+
+def test_corrupt_cache_is_rebuilt(tmp_path):
+    cache_path = tmp_path / "blocklist.cache"
+    cache_path.write_bytes(b"not marshal data")
+    assert load_index(["reddit.com"], [], cache_path).is_blocked("reddit.com")
@@ -0,0 +1,73 @@
+# test_focus_mode.py
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "productivity_dashboard"))
+
+import focus_mode
+from focus_mode import BLOCK_END, BLOCK_START, LEGACY_MARKER, FocusMode
+
+HOSTS = "127.0.0.1 localhost\n::1 localhost\n"
+
+@pytest.fixture
+def hosts(tmp_path):
+    path = tmp_path / "hosts"
+    path.write_bytes(HOSTS.encode())
+    return path
+
+def make_focus_mode(hosts, tmp_path, sites=("reddit.com",)):
+    return FocusMode(sites=list(sites), hosts_path=hosts, cache_path=tmp_path / "blocklist.cache")
+
+def test_enable_twice_gives_same_file(hosts, tmp_path):
+    focus = make_focus_mode(hosts, tmp_path)
+    assert focus.enable()
+    first = hosts.read_bytes()
+    assert focus.enable()
+    assert hosts.read_bytes() == first
+    assert first.decode() == HOSTS + f"\n{BLOCK_START}\n127.0.0.1 reddit.com\n127.0.0.1 www.reddit.com\n{BLOCK_END}\n"
+
+def test_enable_removes_legacy_block(hosts, tmp_path):
+    hosts.write_text(HOSTS + f"\n{LEGACY_MARKER}\n127.0.0.1 old.example\n127.0.0.1 www.old.example\n")
+    focus = make_focus_mode(hosts, tmp_path)
+    assert focus.is_active
+    assert focus.enable()
+
+    content = hosts.read_text()
+    assert LEGACY_MARKER + "\n" not in content
+    assert "old.example" not in content
+    assert content.count(BLOCK_START) == 1
+
+def test_enable_skips_hostnames_user_maps(hosts, tmp_path):
+    hosts.write_text(HOSTS + "10.0.0.5 www.reddit.com  # work mirror\n")
+    focus = make_focus_mode(hosts, tmp_path)
+    assert focus.enable()
+
+    content = hosts.read_text()
+    block = content[content.index(BLOCK_START):]
+    assert "127.0.0.1 reddit.com\n" in block
+    assert "www.reddit.com" not in block
+    assert "10.0.0.5 www.reddit.com  # work mirror\n" in content
+
+@pytest.mark.parametrize("original", [HOSTS, HOSTS + "\n", HOSTS + "\n\n", "", "127.0.0.1 localhost"])
+def test_enable_then_disable_restores_original(hosts, tmp_path, original):
+    hosts.write_bytes(original.encode())
+    focus = make_focus_mode(hosts, tmp_path)
+    assert focus.enable()
+    assert focus.disable()
+    assert not focus.is_active
+
+    expected = original if not original or original.endswith("\n") else original + "\n"
+    assert hosts.read_bytes() == expected.encode()
+
+def test_failed_write_keeps_original(hosts, tmp_path, monkeypatch):
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(focus_mode.os, "replace", fail)
+    focus = make_focus_mode(hosts, tmp_path)
+    assert not focus.enable()
+
+    assert hosts.read_bytes() == HOSTS.encode()
+    assert not list(tmp_path.glob(".hosts.*.tmp"))